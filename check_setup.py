@@ -1,12 +1,26 @@
 import os
+import re
 import sys
+from importlib.metadata import version, PackageNotFoundError
 from dotenv import load_dotenv
 
+# Oldest releases the code works with (keyed st.expander with on_change/.open, st.fragment;
+# pandas 3 copy-on-write, which the dashboard's shared cached frame relies on)
+MIN_VERSIONS = {
+    'streamlit': (1, 65),
+    'pandas': (3, 0),
+}
+
+
+def _version_tuple(v):
+    return tuple(int(part) for part in re.findall(r'\d+', v)[:2])
+
+
 def check_setup():
     print("🔍 Starting Job Application Preprocessor Setup Check...\n")
     
     # 1. Check Python version
-    print(f"🐍 Python Version: {sys.version.split()[0]} - {'OK' if sys.version_info >= (3, 10) else 'WARNING: Python 3.10+ recommended'}")
+    print(f"🐍 Python Version: {sys.version.split()[0]} - {'OK' if sys.version_info >= (3, 11) else 'WARNING: Python 3.11+ required (pandas 3)'}")
     
     # 2. Check Dependencies
     dependencies = [
@@ -22,16 +36,31 @@ def check_setup():
     
     print("\n📦 Checking Dependencies:")
     missing_deps = []
+    outdated_deps = []
     for module, package in dependencies:
         try:
             __import__(module)
-            print(f"  ✅ {package} is installed")
         except ImportError:
             print(f"  ❌ {package} is MISSING")
             missing_deps.append(package)
+            continue
+        minimum = MIN_VERSIONS.get(package)
+        if minimum:
+            try:
+                installed = version(package)
+            except PackageNotFoundError:
+                installed = "0"
+            if _version_tuple(installed) < minimum:
+                required = '.'.join(map(str, minimum))
+                print(f"  ❌ {package} {installed} is too old ({required}+ required)")
+                outdated_deps.append(f"{package}>={required}")
+                continue
+        print(f"  ✅ {package} is installed")
             
     if missing_deps:
         print(f"\n👉 Please run: pip install {' '.join(missing_deps)}")
+    if outdated_deps:
+        print(f"\n👉 Please run: pip install --upgrade {' '.join(repr(d) for d in outdated_deps)}")
 
     # 3. Check .env file
     print("\n📄 Checking .env file:")
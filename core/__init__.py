@@ -4,7 +4,7 @@ Keeps the app data-source agnostic (Apify, LinkedIn, other boards) and testable.
 """
 
 from .models import Job, Company
-from .sources import DataSource, ApifyDataSource, LinkedInDataSource
+from .sources import DataSource, ApifyDataSource, LinkedInDataSource, get_source
 from .repository import JobRepository
 from .services import JobAnalysisService, ResumeGenerationService
 
@@ -14,6 +14,7 @@ __all__ = [
     "DataSource",
     "ApifyDataSource",
     "LinkedInDataSource",
+    "get_source",
     "JobRepository",
     "JobAnalysisService",
     "ResumeGenerationService",
@@ -2,22 +2,17 @@
 
 from typing import Any
 
-from .sources import DataSource, ApifyDataSource, LinkedInDataSource
+from .sources import DataSource, get_source
 from .repository import JobRepository
 
 
-def create_data_source(name: str, **kwargs: Any) -> DataSource:
+def create_data_source(name: str) -> DataSource:
     """
-    Create a DataSource by name. Use for DI or when switching sources without changing callers.
+    Get a DataSource by name. Use for DI or when switching sources without changing callers.
 
-    Supported names: 'apify', 'linkedin'.
+    Supported names: 'apify', 'linkedin'. Sources are stateless, so the shared registry instance is returned.
     """
-    name_lower = (name or "").strip().lower()
-    if name_lower == "apify":
-        return ApifyDataSource(**kwargs)
-    if name_lower == "linkedin":
-        return LinkedInDataSource(**kwargs)
-    raise ValueError(f"Unknown data source: {name!r}. Use 'apify' or 'linkedin'.")
+    return get_source(name)
 
 
 def create_repository(job_store: Any) -> JobRepository:
@@ -2,4 +2,19 @@ from .base import DataSource
 from .apify_source import ApifyDataSource
 from .linkedin_source import LinkedInDataSource
 
-__all__ = ["DataSource", "ApifyDataSource", "LinkedInDataSource"]
+# Sources are stateless, so one shared instance per name is enough for the whole process.
+SOURCES: dict[str, DataSource] = {
+    "apify": ApifyDataSource(),
+    "linkedin": LinkedInDataSource(),
+}
+
+
+def get_source(name: str) -> DataSource:
+    """Return the shared DataSource registered under name ('apify', 'linkedin')."""
+    try:
+        return SOURCES[(name or "").strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown data source: {name!r}. Use {' or '.join(repr(n) for n in SOURCES)}.") from None
+
+
+__all__ = ["DataSource", "ApifyDataSource", "LinkedInDataSource", "SOURCES", "get_source"]
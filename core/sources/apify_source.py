@@ -1,5 +1,6 @@
 """Apify-based job listing data source."""
 
+from dataclasses import dataclass
 from typing import Any, Iterator
 
 import utils
@@ -25,27 +26,39 @@ def _normalize_apify_item(item: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+@dataclass(frozen=True, slots=True)
 class ApifyDataSource:
-    """DataSource implementation using Apify LinkedIn jobs actor."""
+    """DataSource implementation using Apify LinkedIn jobs actor. Stateless; use the shared instance from get_source()."""
 
     def fetch_jobs(
         self,
         search_url: str | None = None,
         params: dict[str, Any] | None = None,
+        *,
+        max_items: int | None = None,
         **kwargs: Any,
     ) -> Iterator[dict[str, Any]]:
+        """Yield normalized Apify items; stop after max_items valid jobs when given."""
         if not params and not search_url:
             return
         if not utils.APIFY_AVAILABLE:
             return
         items = fetch_jobs_via_apify(search_url=search_url, params=params)
+        yielded = 0
         for item in items:
             try:
                 normalized = _normalize_apify_item(item)
-                if normalized["company_name"] and normalized["job_title"] and normalized["job_url"]:
-                    yield normalized
             except Exception:
                 continue
+            if normalized["company_name"] and normalized["job_title"] and normalized["job_url"]:
+                yield normalized
+                yielded += 1
+                if max_items and yielded >= max_items:
+                    # Close a streaming upstream (generator / HTTP iterator) so it stops fetching
+                    close = getattr(items, "close", None)
+                    if close is not None:
+                        close()
+                    return
 
     def is_available(self) -> bool:
         return bool(apify_state.is_available())
@@ -1,5 +1,6 @@
 """LinkedIn direct scraping job listing data source."""
 
+from dataclasses import dataclass
 from typing import Any, Iterator
 
 from utils.linkedin_crawl import scrape_multiple_pages
@@ -37,8 +38,9 @@ def _normalize_linkedin_job_obj(job_obj: Any) -> dict[str, Any] | None:
     }
 
 
+@dataclass(frozen=True, slots=True)
 class LinkedInDataSource:
-    """DataSource implementation using direct LinkedIn scraping (e.g. linkedin_scraper + Selenium)."""
+    """DataSource implementation using direct LinkedIn scraping (e.g. linkedin_scraper + Selenium). Stateless; use the shared instance from get_source()."""
 
     def fetch_jobs(
         self,
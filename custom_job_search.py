@@ -1,9 +1,27 @@
-from linkedin_scraper import JobSearch, Job
+import logging
 from time import sleep
 
+from linkedin_scraper import JobSearch, Job
+
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Same selectors as scrape_job_card, evaluated in the browser for every card at once. A card
+# missing any of them yields null so it goes through scrape_job_card (and is skipped if it fails).
+_SNAPSHOT_CARDS_JS = """
+return arguments[0].map(function(card) {
+    var link = card.querySelector('.job-card-list__title--link');
+    if (!link || !link.innerText.trim()) { return null; }
+    var company = card.querySelector('.artdeco-entity-lockup__subtitle');
+    var location = card.querySelector('.job-card-container__metadata-wrapper');
+    if (!company || !location) { return null; }
+    return [link.innerText, link.href, company.innerText, location.innerText];
+});
+"""
+
 
 class CustomJobSearch(JobSearch):
     """Extended JobSearch class that can scrape jobs from a direct URL"""
@@ -69,9 +87,9 @@ class CustomJobSearch(JobSearch):
             return []
 
         # Scroll the job listing container to load all jobs
-        print("Scrolling to load all jobs...")
+        logger.debug("Scrolling to load all jobs...")
         self.scroll_element_to_bottom(job_listing, pause_time=2)
-        print("Finished scrolling")
+        logger.debug("Finished scrolling")
 
         # Wait a bit for any final jobs to load
         sleep(2)
@@ -97,14 +115,21 @@ class CustomJobSearch(JobSearch):
                     job_cards = job_listing.find_elements(By.CSS_SELECTOR, selector_value)
 
                 if job_cards:
-                    print(f"Found {len(job_cards)} job cards")
+                    logger.debug("Found %d job cards", len(job_cards))
+                    # Read every rendered card in one round-trip before any further scrolling
+                    # can re-layout the list and leave stale element references behind.
+                    snapshots = self.snapshot_job_cards(job_cards)
                     for i, job_card in enumerate(job_cards):
                         try:
-                            self.scroll_into_view(job_card)
-
-                            job = self.scrape_job_card(job_card)
+                            snapshot = snapshots[i] if i < len(snapshots) else None
+                            if snapshot:
+                                job = self._job_from_snapshot(snapshot)
+                            else:
+                                # Card not rendered yet (lazy list); scroll to it and scrape it directly
+                                self.scroll_into_view(job_card)
+                                job = self.scrape_job_card(job_card)
                             job_results.append(job)
-                            print(f"Scraped job {i + 1}/{len(job_cards)}: {job.job_title}")
+                            logger.debug("Scraped job %d/%d: %s", i + 1, len(job_cards), job.job_title)
                         except Exception as e:
                             print(f"Error scraping job card {i + 1}: {e}")
                             continue
@@ -125,6 +150,21 @@ class CustomJobSearch(JobSearch):
 
         return job_results
 
+    def snapshot_job_cards(self, job_cards) -> list:
+        """
+        Extract (title, url, company, location) for all job cards with a single script call.
+
+        Returns one entry per card; entries are None for cards whose content is not rendered yet.
+        """
+        try:
+            return self.driver.execute_script(_SNAPSHOT_CARDS_JS, job_cards) or []
+        except Exception as e:
+            logger.debug("Card snapshot failed, falling back to per-card scraping: %s", e)
+            return []
+
+    def _job_from_snapshot(self, snapshot) -> Job:
+        job_title, linkedin_url, company, location = snapshot
+        return Job(linkedin_url=linkedin_url, job_title=job_title.strip(), company=company, location=location, scrape=False, driver=self.driver)
 
     def scrape_job_card(self, base_element) -> Job:
         job_div = self.wait_for_element_to_load(By.CLASS_NAME, "job-card-list__title--link", base=base_element)
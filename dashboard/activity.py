@@ -1,42 +1,84 @@
 """Activity log view and helpers."""
+import os
+import re
 import time
 import streamlit as st
 from pathlib import Path
 
-from .constants import ACTIVITY_LOG_PATH, ACTIVITY_LOG_TAIL_LINES, ACTIVITY_AUTO_REFRESH_SEC
+from .constants import (
+    ACTIVITY_AUTO_REFRESH_SEC,
+    ACTIVITY_DISPLAY_LIMIT,
+    ACTIVITY_LOG_PATH,
+    ACTIVITY_LOG_TAIL_LINES,
+)
+
+
+_ERROR_RE = re.compile(r"Error|error:|CRITICAL|Traceback|failed|Failed|Exception")
+_WARNING_RE = re.compile(r"Warning|WARNING|⚠️|Skipping|Skipped")
+_SECTION_RE = re.compile(r"Phase|COLLECTION|ANALYSIS|PROCESSING|SUSTAINABILITY|BULK")
+# Banner lines such as "=====", "---", ">>> ***" (spaces allowed between the marks)
+_RULE_RE = re.compile(r"[>=\-!* ]+")
 
 
 def _activity_log_level(line: str) -> str:
     """Classify a log line as error, warning, section, or info for styling."""
-    t = line.strip()
-    if any(x in line for x in ("Error", "error:", "CRITICAL", "Traceback", "failed", "Failed", "Exception")):
+    if _ERROR_RE.search(line):
         return "error"
-    if any(x in line for x in ("Warning", "WARNING", "⚠️", "Skipping", "Skipped")):
+    if _WARNING_RE.search(line):
         return "warning"
+    t = line.strip()
     if not t:
         return "section"
-    if len(t) > 2 and (
-        set(t.replace(" ", "")) <= {">", "=", "-", "!", "*"}
-        or "Phase" in line
-        or "COLLECTION" in line
-        or "ANALYSIS" in line
-        or "PROCESSING" in line
-        or "SUSTAINABILITY" in line
-        or "BULK" in line
-    ):
+    if len(t) > 2 and (_RULE_RE.fullmatch(t) or _SECTION_RE.search(line)):
         return "section"
     return "info"
 
 
+_LOG_CARD_CSS = """
+<style>
+.log-card { border-radius: 10px; padding: 10px 14px; margin: 6px 0; font-family: monospace; font-size: 0.9rem; }
+.log-card.log-error   { border-left: 4px solid #dc3545; background-color: rgba(220, 53, 69, 0.12); }
+.log-card.log-warning { border-left: 4px solid #fd7e14; background-color: rgba(253, 126, 20, 0.12); }
+.log-card.log-section { border-left: 4px solid #6c757d; background-color: rgba(108, 117, 125, 0.12); }
+.log-card.log-info    { border-left: 4px solid #0d6efd; background-color: rgba(13, 110, 253, 0.08); }
+.log-preview { overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
+</style>
+"""
+
+# HTML escapes for log text (safe inside a title="..." attribute), applied in one pass
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Bytes read per backwards step when tailing the log
+_TAIL_CHUNK_SIZE = 64 * 1024
+
+
+def _tail_lines(path: Path, max_lines: int, chunk_size: int = _TAIL_CHUNK_SIZE) -> list[str]:
+    """Last max_lines lines of path (with line endings), read backwards chunk_size bytes at a time."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        chunks = []
+        newlines = 0
+        # One newline more than max_lines guarantees the oldest kept line is complete
+        while pos > 0 and newlines <= max_lines:
+            size = min(chunk_size, pos)
+            pos -= size
+            f.seek(pos)
+            chunk = f.read(size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    lines = b"".join(reversed(chunks)).splitlines(keepends=True)
+    if pos > 0:
+        lines = lines[1:]  # Started mid-line
+    return [line.decode("utf-8", errors="replace") for line in lines[-max_lines:]]
+
+
 @st.cache_data(ttl=2)  # Short TTL so Activity view sees new lines quickly
 def _read_activity_log_tail(max_lines: int = ACTIVITY_LOG_TAIL_LINES) -> list[str]:
-    """Read last max_lines from activity log."""
+    """Read last max_lines from activity log, seeking back from the end instead of reading it all."""
     if not ACTIVITY_LOG_PATH.exists():
         return []
     try:
-        with open(ACTIVITY_LOG_PATH, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-        return lines[-max_lines:] if len(lines) > max_lines else lines
+        return _tail_lines(ACTIVITY_LOG_PATH, max_lines)
     except (OSError, IOError):
         return []
 
@@ -51,19 +93,7 @@ def render_activity_view() -> None:
         st.info("No activity yet. Run the main application to see logs here.")
         return
 
-    st.markdown(
-        """
-        <style>
-        .log-card { border-radius: 10px; padding: 10px 14px; margin: 6px 0; font-family: monospace; font-size: 0.9rem; }
-        .log-card.log-error   { border-left: 4px solid #dc3545; background-color: rgba(220, 53, 69, 0.12); }
-        .log-card.log-warning { border-left: 4px solid #fd7e14; background-color: rgba(253, 126, 20, 0.12); }
-        .log-card.log-section { border-left: 4px solid #6c757d; background-color: rgba(108, 117, 125, 0.12); }
-        .log-card.log-info    { border-left: 4px solid #0d6efd; background-color: rgba(13, 110, 253, 0.08); }
-        .log-preview { overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_LOG_CARD_CSS, unsafe_allow_html=True)
 
     col1, col2, col3 = st.columns([1, 1, 2])
     with col1:
@@ -80,8 +110,11 @@ def render_activity_view() -> None:
             key="activity_level_filter",
         )
 
-    shown = 0
+    cards = []
+    # Newest first; stop as soon as enough matching lines are collected
     for line in reversed(lines):
+        if len(cards) >= ACTIVITY_DISPLAY_LIMIT:
+            break
         text = line.rstrip("\n\r")
         if not text:
             continue
@@ -89,19 +122,16 @@ def render_activity_view() -> None:
         if level_filter and level not in level_filter:
             continue
         preview = text[:120] + ("..." if len(text) > 120 else "")
-        preview_esc = (
-            preview.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
-        )
-        full_esc = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
-        )
-        st.markdown(
-            f'<div class="log-card log-{level}"><span class="log-preview" title="{full_esc[:200]}">{preview_esc}</span></div>',
-            unsafe_allow_html=True,
+        preview_esc = preview.translate(_HTML_ESCAPE)
+        full_esc = text.translate(_HTML_ESCAPE)
+        cards.append(
+            f'<div class="log-card log-{level}"><span class="log-preview" title="{full_esc[:200]}">{preview_esc}</span></div>'
         )
-        shown += 1
+    # One markdown element for all cards instead of one per line
+    if cards:
+        st.markdown("".join(cards), unsafe_allow_html=True)
 
-    st.caption(f"Showing {shown} of last {len(lines)} lines (tail size: {ACTIVITY_LOG_TAIL_LINES}).")
+    st.caption(f"Showing {len(cards)} of last {len(lines)} lines (tail size: {ACTIVITY_LOG_TAIL_LINES}).")
     if auto:
         time.sleep(ACTIVITY_AUTO_REFRESH_SEC)
         st.rerun()
@@ -7,7 +7,7 @@ import streamlit as st
 from setup_server import get_app_root
 
 from .activity import render_activity_view
-from .data import load_job_data
+from .data import db_mtime_ns, flush_pending_updates, load_job_data, set_session_df
 from .jobs_view import render_jobs_view
 from .settings import render_settings_view
 from .styles import CUSTOM_CSS, PAGER_JS
@@ -30,6 +30,9 @@ def main() -> None:
     except OSError:
         pass
 
+    # Checkbox/undo callbacks queue their writes; send them before any view reloads the DB.
+    flush_pending_updates()
+
     view = st.sidebar.radio(
         "View",
         ["Jobs", "Activity", "Settings"],
@@ -56,10 +59,11 @@ def main() -> None:
     st.components.v1.html(PAGER_JS, height=0)
 
     if "df" not in st.session_state:
+        st.session_state.df_mtime_ns = db_mtime_ns()
         df, error = load_job_data()
         if error:
             st.error(error)
             return
-        st.session_state.df = df
+        set_session_df(df)
 
     render_jobs_view()
@@ -9,7 +9,9 @@ UNDO_POPUP_TIMEOUT = 8  # seconds - auto-hide undo popup after this time
 # Activity log (must match main.py ACTIVITY_LOG_PATH)
 ACTIVITY_LOG_PATH = Path("local_data") / "activity.log"
 ACTIVITY_LOG_TAIL_LINES = 500
+ACTIVITY_DISPLAY_LIMIT = 200  # newest matching lines rendered as cards
 ACTIVITY_AUTO_REFRESH_SEC = 5
 
 # PDF preview cache
 MAX_PDF_CACHE_SIZE = 10
+MAX_PDF_PREVIEW_BYTES = 2_000_000  # larger PDFs get only the download button
@@ -1,5 +1,9 @@
 """Data loading, DB updates, and file/resume helpers."""
-import subprocess
+import base64
+import functools
+import itertools
+import os
+import shutil
 import sys
 from pathlib import Path
 
@@ -7,36 +11,65 @@ import pandas as pd
 import streamlit as st
 from dotenv import dotenv_values
 
+from config import CONFIG_FILE, _get_job_filters
 from local_storage import JobDatabase
 from utils import SHEET_HEADER, get_user_name
-from api_methods import get_resume_json
 from setup_server import get_app_root
+from .constants import MAX_PDF_CACHE_SIZE
+
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "n", "off"})
 
 
 def _parse_bool_env(val, default: bool = False) -> bool:
     if val is None:
         return default
     s = str(val).strip().lower()
-    if s in ("1", "true", "yes", "y", "on"):
+    if s in _TRUE_VALUES:
         return True
-    if s in ("0", "false", "no", "n", "off"):
+    if s in _FALSE_VALUES:
         return False
     return default
 
 
-@st.cache_data(ttl=60)  # Short TTL so Settings changes are picked up
+@st.cache_data(max_entries=1, show_spinner=False)
+def _read_check_sustainability(env_path: str, mtime_ns: int) -> bool:
+    """Parse CHECK_SUSTAINABILITY from .env; mtime_ns keys the cache so edits are picked up."""
+    data = dotenv_values(env_path)
+    return _parse_bool_env(data.get("CHECK_SUSTAINABILITY"), default=False)
+
+
 def get_check_sustainability() -> bool:
     """Return True if CHECK_SUSTAINABILITY is enabled in .env (Settings / env / yaml)."""
     env_path = Path(get_app_root()) / ".env"
-    if not env_path.exists():
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except OSError:
         return False
-    data = dotenv_values(env_path)
-    return _parse_bool_env(data.get("CHECK_SUSTAINABILITY"), default=False)
+    return _read_check_sustainability(str(env_path), mtime_ns)
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _read_job_filters(config_path: str, mtime_ns: int) -> dict:
+    """Parse the job preferences YAML; both arguments are only the cache key."""
+    return _get_job_filters()
+
+
+def get_job_filters() -> dict:
+    """Job filters/settings from job_preferences.yaml, re-parsed only when the file changes."""
+    try:
+        mtime_ns = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        mtime_ns = 0  # No file yet: defaults (or a legacy migration) until it appears
+    return _read_job_filters(CONFIG_FILE, mtime_ns)
 
 
 @st.cache_data(ttl=3600)  # Cache for 1 hour - user_name rarely changes
 def get_cached_user_name():
     """Get user name from resume JSON, cached separately."""
+    from api_methods import get_resume_json
+
     try:
         resume_json = get_resume_json()
         return get_user_name(resume_json)
@@ -44,82 +77,248 @@ def get_cached_user_name():
         return None
 
 
+_LINUX_FILE_MANAGERS = ("xdg-open", "nautilus", "dolphin", "thunar", "pcmanfm")
+
+
+@functools.lru_cache(maxsize=1)
+def _linux_file_manager() -> str | None:
+    """Absolute path of the first installed Linux file manager (looked up once per process)."""
+    return next(
+        (path for path in map(shutil.which, _LINUX_FILE_MANAGERS) if path),
+        None,
+    )
+
+
 def open_file_manager(file_path: Path) -> None:
     """Open file manager at the location of the file (OS-agnostic)."""
+    import subprocess
+
     file_path = Path(file_path).resolve()
 
+    # Popen everywhere: don't block the rerun while the GUI starts
     if sys.platform == "win32":
-        subprocess.run(["explorer", "/select,", str(file_path)])
+        subprocess.Popen(["explorer", "/select,", str(file_path)])
     elif sys.platform == "darwin":
-        subprocess.run(["open", "-R", str(file_path)])
+        subprocess.Popen(["open", "-R", str(file_path)])
     else:
         file_dir = file_path.parent
-        managers = [
-            ["xdg-open", str(file_dir)],
-            ["nautilus", str(file_dir)],
-            ["dolphin", str(file_dir)],
-            ["thunar", str(file_dir)],
-            ["pcmanfm", str(file_dir)],
-        ]
-        for manager in managers:
+        manager = _linux_file_manager()
+        if manager:
             try:
-                subprocess.run(manager, check=True)
-                break
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-        else:
-            st.error(f"Could not open file manager. File location: {file_dir}")
+                # Absolute path + close_fds=False lets Popen use posix_spawn instead of fork/exec;
+                # Python's own fds are non-inheritable already, so nothing extra leaks to the child
+                subprocess.Popen([manager, str(file_dir)], close_fds=False)
+                return
+            except OSError:
+                pass
+        st.error(f"Could not open file manager. File location: {file_dir}")
+
+
+def _resume_abspath(resume_url: str) -> str | None:
+    """Absolute, normalized path string for a resume URL/path; relative paths are from the app cwd."""
+    resume_url = resume_url.strip() if resume_url else ""
+    return os.path.abspath(resume_url) if resume_url else None
 
 
 def get_resume_path(resume_url: str) -> Path | None:
     """Convert resume URL/path to absolute Path object. Handles relative paths from local_data/resumes/."""
-    if not resume_url or not resume_url.strip():
-        return None
-
-    resume_url = resume_url.strip()
-    path = Path(resume_url)
+    path = _resume_abspath(resume_url)
+    return Path(path) if path and os.path.exists(path) else None
 
-    if not path.is_absolute():
-        if resume_url.startswith("local_data/"):
-            path = Path(".") / path
-        else:
-            path = Path(".") / path
 
+@st.cache_data(ttl=30, show_spinner=False)  # Short TTL so regenerated resumes show up
+def get_resume_file_info(resume_url: str) -> tuple[Path, int, float] | None:
+    """Return (path, size, mtime) for a resume, or None if the file is missing. Cached across reruns."""
+    path = _resume_abspath(resume_url)
+    if path is None:
+        return None
     try:
-        resolved = path.resolve()
-        return resolved if resolved.exists() else None
+        stat = os.stat(path)  # One stat answers exists, size and mtime
     except (OSError, ValueError):
         return None
+    return Path(path), stat.st_size, stat.st_mtime
+
+
+@st.cache_resource(max_entries=MAX_PDF_CACHE_SIZE, show_spinner="Loading PDF preview...")
+def get_pdf_base64(path_str: str, mtime: float) -> str:
+    """Base64 of a PDF for the inline preview, shared by all sessions. mtime invalidates rewritten files.
+    cache_resource hands back the same immutable str on every hit instead of unpickling a copy.
+    """
+    with open(path_str, "rb") as f:
+        return base64.b64encode(f.read()).decode("ascii")
+
+
+JOBS_DB_PATH = Path("local_data") / "jobs.db"
+
+# WAL lets the dashboard read while main.py writes; the other two are per-connection tuning.
+DB_PRAGMAS = ("journal_mode=WAL", "synchronous=NORMAL", "cache_size=-20000")
+
+# Process-wide counter so versions never collide between sessions in st.cache_data keys.
+_df_versions = itertools.count(1)
+
+# Low-cardinality text columns stored as pandas categoricals (one code per row instead of a string).
+CATEGORICAL_COLUMNS = ("Fit score", "Location", "Company Name", "CO fetch attempted")
+
+# Integer-valued text columns stored as ordered categoricals, so sorting compares codes in numeric
+# order (matching JobDatabase.sort's CAST(... AS INTEGER)) rather than "10" < "2".
+NUMERIC_CATEGORY_COLUMNS = ("Location Priority", "Fit score enum")
+
+# TRUE/FALSE status columns, held as nullable booleans in memory (NA = unknown).
+# SQLite keeps the "TRUE"/"FALSE" strings; see update_job_field callers.
+BOOL_COLUMNS = ("Applied", "Job posting expired", "Bad analysis", "Sustainable company")
+
+_FLAG_VALUES = {"TRUE": True, "FALSE": False}
+
+# Text column -> precomputed bool "is non-empty" column, kept in sync by set_session_cell_by_id.
+PRESENCE_COLUMNS = {
+    "Tailored resume url": "_has_resume",
+    "Tailored cover letter (to be humanized)": "_has_cover_letter",
+    "Job Description": "_has_jd",
+    "Company overview": "_has_co",
+}
+
+
+def flag_to_bool(value):
+    """Map a stored "TRUE"/"FALSE" flag to True/False; anything else is pd.NA."""
+    return _FLAG_VALUES.get(str(value).strip().upper(), pd.NA)
+
+
+def _sort_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return 0  # Blank or non-numeric sorts like SQLite's CAST: as 0
+
+
+def _numeric_category(col: pd.Series) -> pd.Series:
+    """col as an ordered categorical whose categories are in integer order."""
+    categories = sorted(col.unique(), key=lambda v: (_sort_int(v), v))
+    return col.astype(pd.CategoricalDtype(categories, ordered=True))
+
+
+def _db_mtime_ns(db_path: Path) -> int:
+    """Last modification time of the DB, including its WAL file if one exists."""
+    mtime = db_path.stat().st_mtime_ns
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    if wal_path.exists():
+        mtime = max(mtime, wal_path.stat().st_mtime_ns)
+    return mtime
+
+
+def db_mtime_ns() -> int:
+    """Current mtime of the jobs DB (0 if it does not exist yet); changes on every write."""
+    try:
+        return _db_mtime_ns(JOBS_DB_PATH)
+    except OSError:
+        return 0
+
+
+# No TTL: the mtime argument changes on every write, which is the only time the data changes.
+# cache_resource returns the one shared frame (no pickle round-trip); callers must not mutate it.
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _read_jobs_frame(db_path: str, mtime_ns: int) -> pd.DataFrame:
+    """Read the jobs table straight into a DataFrame. Both arguments are only part of the cache key."""
+    # SHEET_HEADER columns, NULL -> '', indexed by DB row id (a job keeps its label across reloads)
+    return _typed_jobs_frame(get_db().get_all_as_dataframe(read_only=True))
+
+
+def _typed_jobs_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the all-text jobs frame to the dashboard's in-memory dtypes, in place; returns df."""
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype("category")
+    for col in NUMERIC_CATEGORY_COLUMNS:
+        df[col] = _numeric_category(df[col])
+    for col in BOOL_COLUMNS:
+        df[col] = df[col].str.strip().str.upper().map(_FLAG_VALUES).astype("boolean")
+    for col, has_col in PRESENCE_COLUMNS.items():
+        df[has_col] = df[col].ne("").to_numpy(dtype=bool)
+    return df
 
 
-@st.cache_data(ttl=60)  # 1 minute so dashboard sees main.py JD/expiry updates soon after refresh
 def load_job_data():
-    """Load job data from SQLite database."""
+    """Load job data from SQLite database. Reuses the cached frame until the DB file changes."""
     try:
-        db_path = Path("local_data") / "jobs.db"
+        db_path = JOBS_DB_PATH
         if not db_path.exists():
             return None, "No job data found. Please run the main application first."
 
-        db = JobDatabase(str(db_path), SHEET_HEADER)
-        records = db.get_all_records()
+        df = _read_jobs_frame(str(db_path), _db_mtime_ns(db_path))
 
-        if not records:
+        if df.empty:
             return None, "No jobs found in the database."
 
-        df = pd.DataFrame(records)
-        return df, None
+        # Sessions edit their frame in place; a shallow copy is enough under copy-on-write (always on
+        # from pandas 3, hence the pin in requirements.txt): the first write to a column copies just
+        # that column and the frame shared across sessions stays intact
+        return df.copy(deep=False), None
     except Exception as e:
         return None, f"Error loading data: {str(e)}"
 
 
+def bump_df_version() -> int:
+    """Mark st.session_state.df as changed. Call after replacing or editing it in place."""
+    st.session_state.df_version = next(_df_versions)
+    return st.session_state.df_version
+
+
+def set_session_df(df: pd.DataFrame | None) -> None:
+    """Install a freshly loaded frame: store it, rebuild the row lookup, bump df_version."""
+    st.session_state.df = df
+    # (Job URL, Company Name) -> index label, so single-cell edits skip a full-column compare
+    st.session_state.row_lookup = (
+        dict(zip(zip(df["Job URL"], df["Company Name"]), df.index)) if df is not None else {}
+    )
+    bump_df_version()
+
+
+def set_session_cell_by_id(job_key: int | None, field_name: str, value) -> None:
+    """Set one cell of st.session_state.df by row id and bump df_version; ids not loaded are skipped."""
+    df = st.session_state.df
+    # Membership check first: .at on a missing label would append a row
+    if job_key is not None and job_key in df.index:
+        df.at[job_key, field_name] = value
+        if field_name in PRESENCE_COLUMNS:
+            df.at[job_key, PRESENCE_COLUMNS[field_name]] = bool(value)
+    bump_df_version()
+
+
+def set_session_cell(job_url_key: str, company_key: str, field_name: str, value) -> None:
+    """Set one cell of st.session_state.df, found by (Job URL, Company Name), and bump df_version."""
+    job_key = st.session_state.get("row_lookup", {}).get((job_url_key, company_key))
+    set_session_cell_by_id(job_key, field_name, value)
+
+
+@st.cache_resource
+def get_db() -> JobDatabase:
+    """Shared JobDatabase for the dashboard process (schema check runs once, not per edit)."""
+    return JobDatabase(str(JOBS_DB_PATH), SHEET_HEADER, pragmas=DB_PRAGMAS)
+
+
 def update_job_field(job_url_key: str, company_key: str, field_name: str, value: str) -> int:
     """Update a single field for a job in the database."""
-    db_path = Path("local_data") / "jobs.db"
-    if not db_path.exists():
+    if not JOBS_DB_PATH.exists():
         return 0
 
-    db = JobDatabase(str(db_path), SHEET_HEADER)
-    return db.update_job_by_key(job_url_key, company_key, {field_name: value})
+    return get_db().update_job_by_key(job_url_key, company_key, {field_name: value})
+
+
+def queue_job_update(job_url_key: str, company_key: str, field_name: str, value: str) -> None:
+    """Queue a DB write; flush_pending_updates() sends the queue in one transaction.
+    Writes are merged per job, so several fields (or repeated toggles) become one UPDATE of the latest values.
+    """
+    pending = st.session_state.setdefault("pending_updates", {})
+    pending.setdefault((job_url_key, company_key), {})[field_name] = value
+
+
+def flush_pending_updates() -> None:
+    """Write queued updates with JobDatabase.bulk_update_by_key. Run before anything reloads the DB."""
+    pending = st.session_state.get("pending_updates")
+    if not pending or not JOBS_DB_PATH.exists():
+        return
+    get_db().bulk_update_by_key(
+        [(job_url, company, fields) for (job_url, company), fields in pending.items()]
+    )
+    st.session_state.pending_updates = {}
 
 
 def handle_field_update(
@@ -135,18 +334,8 @@ def handle_field_update(
         rows_affected = update_job_field(job_url_key, company_key, field_name, new_value)
         if rows_affected > 0:
             st.success(success_msg)
-            if "df" in st.session_state:
-                df = st.session_state.df
-                mask = (df.get("Job URL", "") == job_url_key) & (
-                    df.get("Company Name", "") == company_key
-                )
-                df.loc[mask, field_name] = new_value
-                st.session_state.df = df
-                if "filter_options_cache" in st.session_state:
-                    del st.session_state.filter_options_cache
-                if "df_hash" in st.session_state:
-                    del st.session_state.df_hash
-            st.cache_data.clear()
+            if st.session_state.get("df") is not None:
+                set_session_cell(job_url_key, company_key, field_name, new_value)
             st.rerun()
         else:
             st.error(f"Failed to update {field_name}. Record not found in database.")
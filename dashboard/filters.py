@@ -1,4 +1,5 @@
 """Sidebar filters and filter mask application for the Jobs view."""
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -6,7 +7,7 @@ import streamlit as st
 JD_FILTER_OPTIONS = ["Unset", "Has", "Missing"]
 
 
-# Keys that hold filter state (must match what we read in render_sidebar_filters / apply_filter_mask).
+# Keys that hold filter state (must match what we read in render_sidebar_filters / filter_positions).
 FILTER_KEYS = (
     "filter_fit_score",
     "filter_applied_status",
@@ -23,6 +24,11 @@ FILTER_KEYS = (
 )
 
 
+def mark_pagination_dirty() -> None:
+    """on_change for filter and sort widgets: the next run starts the job list at page 1."""
+    st.session_state.pagination_dirty = True
+
+
 def clear_all_filter_keys() -> None:
     """Clear all filters to show-all state (empty multiselects, Unset for radio). Call before st.rerun()."""
     st.session_state.filter_fit_score = []
@@ -37,11 +43,12 @@ def clear_all_filter_keys() -> None:
     st.session_state.filter_priority_only = False
     st.session_state.jd_data_filter = "Unset"
     st.session_state.co_data_filter = "Unset"
+    mark_pagination_dirty()
 
 
 def apply_default_filter_keys(cache: dict) -> None:
     """Set all filters to default presets (exclude poor fits, show Not Applied/Active/etc). Call before st.rerun()."""
-    st.session_state.filter_fit_score = list(cache.get("default_fit_scores", ["Unknown"]))
+    st.session_state.filter_fit_score = list(cache.get("default_fit_scores", ("Unknown",)))
     st.session_state.filter_applied_status = ["Not Applied", "Unknown"]
     st.session_state.filter_expired_status = ["Active", "Unknown"]
     st.session_state.filter_bad_analysis = ["No", "Unknown"]
@@ -53,6 +60,7 @@ def apply_default_filter_keys(cache: dict) -> None:
     st.session_state.filter_priority_only = False
     st.session_state.jd_data_filter = "Unset"
     st.session_state.co_data_filter = "Unset"
+    mark_pagination_dirty()
 
 
 def normalize_multiselect(selection):
@@ -60,74 +68,49 @@ def normalize_multiselect(selection):
     return selection if selection else []
 
 
-def ensure_filter_cache(df: pd.DataFrame) -> None:
-    """Ensure filter_options_cache and df_hash are in session state; invalidate if df changed."""
-    if "filter_options_cache" not in st.session_state or "df_hash" not in st.session_state:
+def ensure_filter_cache(df: pd.DataFrame, df_version: int) -> None:
+    """Ensure filter_options_cache is in session state and was built from this df_version."""
+    if (
+        "filter_options_cache" not in st.session_state
+        or st.session_state.get("filter_options_version") != df_version
+    ):
         _build_filter_cache(df)
-        return
-    current_df_hash = _df_hash(df)
-    if current_df_hash != st.session_state.df_hash:
-        if "filter_options_cache" in st.session_state:
-            del st.session_state.filter_options_cache
-        if "df_hash" in st.session_state:
-            del st.session_state.df_hash
-        st.rerun()
-    else:
-        cache = st.session_state.filter_options_cache
-        if "filter_fit_score" not in st.session_state:
-            st.session_state.filter_fit_score = cache["default_fit_scores"]
-
-
-def _df_hash(df: pd.DataFrame):
-    if len(df) > 0:
-        sample_indices = [0]
-        if len(df) > 1:
-            sample_indices.append(len(df) - 1)
-        if len(df) > 2:
-            sample_indices.append(len(df) // 2)
-        if len(df) > 10:
-            step = len(df) // 5
-            sample_indices.extend([step * i for i in range(1, 5) if step * i < len(df)])
-        sample_urls = tuple(
-            df["Job URL"].iloc[i] if i < len(df) else "" for i in sorted(set(sample_indices))
-        )
-        return hash((len(df), tuple(df.columns), sample_urls))
-    return hash((0, tuple(df.columns), ()))
+        st.session_state.filter_options_version = df_version
+    elif "filter_fit_score" not in st.session_state:
+        st.session_state.filter_fit_score = list(st.session_state.filter_options_cache["default_fit_scores"])
+
+
+def _category_options(col: pd.Series) -> list:
+    """Sorted non-empty values of a categorical column (its categories are already sorted uniques)."""
+    categories = col.cat.categories
+    return categories[categories != ""].tolist()
 
 
 def _build_filter_cache(df: pd.DataFrame) -> None:
-    df_hash = _df_hash(df)
-    st.session_state.df_hash = df_hash
-    fit_score_options = sorted(
-        [s for s in df["Fit score"].dropna().unique().tolist() if s], reverse=True
-    )
+    fit_score_options = _category_options(df["Fit score"])[::-1]
     bad_fits = ["Poor fit", "Very poor fit", "Questionable fit"]
     # Default view excludes poor fits and moderate fit (only Very good / Good fit + Unknown)
     default_exclude = bad_fits + ["Moderate fit"]
     default_fit_scores = [s for s in fit_score_options if s not in default_exclude]
     if "Unknown" not in default_fit_scores:
         default_fit_scores.append("Unknown")
-    locations = sorted([l for l in df["Location"].dropna().unique().tolist() if l])
-    companies = sorted([c for c in df["Company Name"].dropna().unique().tolist() if c])
+    # Widget option lists are built here once per df_version, "Unknown" first, and kept immutable
     st.session_state.filter_options_cache = {
-        "fit_score_options": fit_score_options,
-        "default_fit_scores": default_fit_scores,
-        "locations": locations,
-        "companies": companies,
+        "fit_score_options": ("Unknown", *fit_score_options),
+        "default_fit_scores": tuple(default_fit_scores),
+        "locations": ("Unknown", *_category_options(df["Location"])),
+        "companies": ("Unknown", *_category_options(df["Company Name"])),
+        "derived_masks": derived_masks(df),
     }
     if "filter_fit_score" not in st.session_state:
         st.session_state.filter_fit_score = default_fit_scores
 
 
 def render_sidebar_filters(df: pd.DataFrame, check_sustainability_enabled: bool = False) -> dict:
-    """Render sidebar filter widgets and return a dict of selections for apply_filter_mask.
+    """Render sidebar filter widgets and return a dict of selections for filter_positions.
     Sustainable filter and priority checkbox only shown when check_sustainability_enabled (from .env).
     """
     cache = st.session_state.filter_options_cache
-    fit_score_options = cache["fit_score_options"]
-    default_fit_scores = cache["default_fit_scores"]
-    locations = cache["locations"]
-    companies = cache["companies"]
 
     st.sidebar.header("🔍 Filters")
     clear_col, default_col = st.sidebar.columns(2)
@@ -143,11 +126,11 @@ def render_sidebar_filters(df: pd.DataFrame, check_sustainability_enabled: bool
 
     # Use only key= for keyed widgets so Streamlit uses session_state[key] as the value.
     # Passing default= with key= can cause widgets to reset on rerun (e.g. after Refresh or filter change).
-    fit_score_options_with_meta = ["Unknown"] + fit_score_options
     selected_fit_scores_raw = st.sidebar.multiselect(
         "Fit Score",
-        fit_score_options_with_meta,
+        cache["fit_score_options"],
         key="filter_fit_score",
+        on_change=mark_pagination_dirty,
     )
     selected_fit_scores = normalize_multiselect(selected_fit_scores_raw)
 
@@ -156,6 +139,7 @@ def render_sidebar_filters(df: pd.DataFrame, check_sustainability_enabled: bool
         "Applied Status",
         applied_options,
         key="filter_applied_status",
+        on_change=mark_pagination_dirty,
     )
     selected_applied = normalize_multiselect(selected_applied_raw)
 
@@ -164,6 +148,7 @@ def render_sidebar_filters(df: pd.DataFrame, check_sustainability_enabled: bool
         "Has Resume",
         has_resume_options,
         key="filter_has_resume",
+        on_change=mark_pagination_dirty,
     )
     selected_resume = normalize_multiselect(selected_resume_raw)
 
@@ -172,6 +157,7 @@ def render_sidebar_filters(df: pd.DataFrame, check_sustainability_enabled: bool
         "Has Cover Letter",
         has_cl_options,
         key="filter_has_cover_letter",
+        on_change=mark_pagination_dirty,
     )
     selected_cl = normalize_multiselect(selected_cl_raw)
 
@@ -180,24 +166,24 @@ def render_sidebar_filters(df: pd.DataFrame, check_sustainability_enabled: bool
         "Expired Status",
         expired_options,
         key="filter_expired_status",
+        on_change=mark_pagination_dirty,
     )
     selected_expired = normalize_multiselect(selected_expired_raw)
 
-    if "Bad analysis" in df.columns:
-        selected_bad_analysis_raw = st.sidebar.multiselect(
-            "Bad Analysis",
-            ["Yes", "No", "Unknown"],
-            key="filter_bad_analysis",
-        )
-        selected_bad_analysis = normalize_multiselect(selected_bad_analysis_raw)
-    else:
-        selected_bad_analysis = []
+    selected_bad_analysis_raw = st.sidebar.multiselect(
+        "Bad Analysis",
+        ["Yes", "No", "Unknown"],
+        key="filter_bad_analysis",
+        on_change=mark_pagination_dirty,
+    )
+    selected_bad_analysis = normalize_multiselect(selected_bad_analysis_raw)
 
-    if check_sustainability_enabled and "Sustainable company" in df.columns:
+    if check_sustainability_enabled:
         selected_sustainable_raw = st.sidebar.multiselect(
             "Sustainable Company",
             ["Yes", "No", "Unknown"],
             key="filter_sustainable_company",
+            on_change=mark_pagination_dirty,
         )
         selected_sustainable = normalize_multiselect(selected_sustainable_raw)
     else:
@@ -210,20 +196,20 @@ def render_sidebar_filters(df: pd.DataFrame, check_sustainability_enabled: bool
         "Job Description",
         JD_FILTER_OPTIONS,
         key="jd_data_filter",
+        on_change=mark_pagination_dirty,
+    )
+    selected_co_data = st.sidebar.radio(
+        "Company Overview",
+        JD_FILTER_OPTIONS,
+        key="co_data_filter",
+        on_change=mark_pagination_dirty,
     )
-    if "Company overview" in df.columns:
-        selected_co_data = st.sidebar.radio(
-            "Company Overview",
-            JD_FILTER_OPTIONS,
-            key="co_data_filter",
-        )
-    else:
-        selected_co_data = "Unset"
 
-    if check_sustainability_enabled and "Sustainable company" in df.columns:
+    if check_sustainability_enabled:
         show_priority_only = st.sidebar.checkbox(
             "🔴 Show only sustainable jobs missing descriptions",
             key="filter_priority_only",
+            on_change=mark_pagination_dirty,
         )
     else:
         show_priority_only = False
@@ -232,15 +218,17 @@ def render_sidebar_filters(df: pd.DataFrame, check_sustainability_enabled: bool
     st.sidebar.caption("📍 Location & Company Filters")
     selected_locations_raw = st.sidebar.multiselect(
         "Location",
-        ["Unknown"] + locations,
+        cache["locations"],
         key="filter_locations",
+        on_change=mark_pagination_dirty,
     )
     selected_locations = normalize_multiselect(selected_locations_raw)
 
     selected_company_raw = st.sidebar.multiselect(
         "Company",
-        ["Unknown"] + companies,
+        cache["companies"],
         key="filter_companies",
+        on_change=mark_pagination_dirty,
     )
     selected_company = normalize_multiselect(selected_company_raw)
 
@@ -269,9 +257,112 @@ def render_sidebar_filters(df: pd.DataFrame, check_sustainability_enabled: bool
     }
 
 
-def apply_filter_mask(df: pd.DataFrame, selections: dict) -> pd.DataFrame:
-    """Apply filter mask from selections; return filtered DataFrame."""
-    filter_mask = pd.Series([True] * len(df), index=df.index)
+def _is_true(df: pd.DataFrame, col: str) -> np.ndarray:
+    """True where a boolean status column is True (NA counts as not True)."""
+    return df[col].to_numpy(dtype=bool, na_value=False)
+
+
+def _is_false(df: pd.DataFrame, col: str) -> np.ndarray:
+    """True where a boolean status column is False (NA counts as not False)."""
+    return ~df[col].to_numpy(dtype=bool, na_value=True)
+
+
+def _category_codes(col: pd.Series, values) -> np.ndarray:
+    """Integer codes of the given values in a categorical column (values not present are dropped)."""
+    codes = col.cat.categories.get_indexer(list(values))
+    return codes[codes >= 0]
+
+
+def _is_blank(df: pd.DataFrame, col: str) -> np.ndarray:
+    """True where a column is missing or an empty string."""
+    series = df[col]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        return np.isin(codes, np.append(_category_codes(series, [""]), -1))
+    if isinstance(series.dtype, pd.BooleanDtype):
+        return series.isna().to_numpy()
+    return (series.isna() | (series == "")).to_numpy(dtype=bool)
+
+
+def _in_or_unknown(df: pd.DataFrame, col: str, selected: list, blank: np.ndarray) -> np.ndarray:
+    """isin() mask for a multiselect; the "Unknown" option also matches blank cells (the blank mask).
+    Categorical columns are matched on their integer codes rather than the strings.
+    """
+    series = df[col]
+    wanted = [v for v in selected if v != "Unknown"]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        mask = np.isin(series.cat.codes.to_numpy(), _category_codes(series, wanted))
+    else:
+        mask = series.isin(wanted).to_numpy(dtype=bool)
+    if "Unknown" in selected:
+        mask = mask | blank
+    return mask
+
+
+# Status column -> sidebar option -> derived mask kind it selects ("not_true" keeps NA rows, "false" does not)
+_STATUS_OPTIONS = {
+    "Applied": {"Applied": "true", "Not Applied": "not_true", "Unknown": "blank"},
+    "Bad analysis": {"Yes": "true", "No": "not_true", "Unknown": "blank"},
+    "Job posting expired": {"Expired": "true", "Active": "not_true", "Unknown": "blank"},
+    "Sustainable company": {"Yes": "true", "No": "false", "Unknown": "blank"},
+}
+_STATUS_COLUMNS = tuple(_STATUS_OPTIONS)
+_MULTISELECT_COLUMNS = ("Fit score", "Location", "Company Name")
+
+
+def derived_masks(df: pd.DataFrame) -> dict:
+    """Per-row flags the filters reuse until the data changes, keyed by (column, kind).
+    Status columns get "true"/"not_true"/"false"/"blank"; multiselect columns get "blank" (the Unknown option).
+    """
+    masks = {}
+    for col in _STATUS_COLUMNS:
+        masks[col, "true"] = _is_true(df, col)
+        masks[col, "not_true"] = ~masks[col, "true"]
+        masks[col, "false"] = _is_false(df, col)
+        masks[col, "blank"] = _is_blank(df, col)
+    for col in _MULTISELECT_COLUMNS:
+        masks[col, "blank"] = _is_blank(df, col)
+    for mask in masks.values():
+        mask.setflags(write=False)  # Shared across reruns; combine into fresh arrays only
+    return masks
+
+
+def _status_mask(masks: dict, col: str, selected: list, n: int) -> np.ndarray:
+    """OR of the derived masks for the options selected on one status column."""
+    out = np.zeros(n, dtype=bool)
+    for kind in {_STATUS_OPTIONS[col][option] for option in selected if option in _STATUS_OPTIONS[col]}:
+        np.logical_or(out, masks[col, kind], out=out)
+    return out
+
+
+def filters_active(selections: dict) -> bool:
+    """False when every filter is in its show-all state (empty multiselects, Unset radios, no priority)."""
+    return bool(
+        selections["selected_fit_scores"]
+        or selections["selected_applied"]
+        or selections.get("selected_bad_analysis")
+        or selections["selected_expired"]
+        or selections.get("selected_sustainable")
+        or selections["selected_resume"]
+        or selections["selected_cl"]
+        or selections["selected_locations"]
+        or selections["selected_company"]
+        or selections["selected_jd_data"] != "Unset"
+        or selections["selected_co_data"] != "Unset"
+        or selections["show_priority_only"]
+    )
+
+
+def build_filter_mask(df: pd.DataFrame, selections: dict, masks: dict | None = None) -> np.ndarray:
+    """Boolean row mask for df from the sidebar selections.
+    Predicates are isin() on categoricals and reads of precomputed bool arrays, ANDed in place;
+    df.query/numexpr would not help here (no string 'in' support) and is not a dependency.
+    masks is derived_masks(df), passed in when the caller already has it for this df.
+    """
+    if masks is None:
+        masks = derived_masks(df)
+    n = len(df)
+    filter_mask = np.ones(n, dtype=bool)
     selected_fit_scores = selections["selected_fit_scores"]
     selected_applied = selections["selected_applied"]
     selected_bad_analysis = selections.get("selected_bad_analysis") or []
@@ -286,128 +377,91 @@ def apply_filter_mask(df: pd.DataFrame, selections: dict) -> pd.DataFrame:
     show_priority_only = selections["show_priority_only"]
 
     if selected_fit_scores:
-        if "Unknown" in selected_fit_scores:
-            fit_mask = (
-                df["Fit score"].isna()
-                | (df["Fit score"] == "")
-                | df["Fit score"].isin([s for s in selected_fit_scores if s != "Unknown"])
-            )
-        else:
-            fit_mask = df["Fit score"].isin(selected_fit_scores)
-        filter_mask = filter_mask & fit_mask
-
-    if "Applied" in df.columns and selected_applied:
-        applied_mask = pd.Series([False] * len(df), index=df.index)
-        if "Applied" in selected_applied:
-            applied_mask = applied_mask | (df["Applied"] == "TRUE")
-        if "Not Applied" in selected_applied:
-            applied_mask = applied_mask | (df["Applied"] != "TRUE")
-        if "Unknown" in selected_applied:
-            applied_mask = applied_mask | (df["Applied"].isna() | (df["Applied"] == ""))
-        filter_mask = filter_mask & applied_mask
-
-    if "Bad analysis" in df.columns and selected_bad_analysis:
-        bad_analysis_mask = pd.Series([False] * len(df), index=df.index)
-        if "Yes" in selected_bad_analysis:
-            bad_analysis_mask = bad_analysis_mask | (df["Bad analysis"] == "TRUE")
-        if "No" in selected_bad_analysis:
-            bad_analysis_mask = bad_analysis_mask | (df["Bad analysis"] != "TRUE")
-        if "Unknown" in selected_bad_analysis:
-            bad_analysis_mask = bad_analysis_mask | (
-                df["Bad analysis"].isna() | (df["Bad analysis"] == "")
-            )
-        filter_mask = filter_mask & bad_analysis_mask
-
-    if "Job posting expired" in df.columns and selected_expired:
-        expired_mask = pd.Series([False] * len(df), index=df.index)
-        if "Expired" in selected_expired:
-            expired_mask = expired_mask | (df["Job posting expired"] == "TRUE")
-        if "Active" in selected_expired:
-            expired_mask = expired_mask | (df["Job posting expired"] != "TRUE")
-        if "Unknown" in selected_expired:
-            expired_mask = expired_mask | (
-                df["Job posting expired"].isna() | (df["Job posting expired"] == "")
-            )
-        filter_mask = filter_mask & expired_mask
-
-    if "Sustainable company" in df.columns and selected_sustainable:
-        sustainable_mask = pd.Series([False] * len(df), index=df.index)
-        if "Yes" in selected_sustainable:
-            sustainable_mask = sustainable_mask | (df["Sustainable company"] == "TRUE")
-        if "No" in selected_sustainable:
-            sustainable_mask = sustainable_mask | (df["Sustainable company"] == "FALSE")
-        if "Unknown" in selected_sustainable:
-            sustainable_mask = sustainable_mask | (
-                df["Sustainable company"].isna() | (df["Sustainable company"] == "")
-            )
-        filter_mask = filter_mask & sustainable_mask
+        filter_mask &= _in_or_unknown(df, "Fit score", selected_fit_scores, masks["Fit score", "blank"])
+
+    for col, selected in (
+        ("Applied", selected_applied),
+        ("Bad analysis", selected_bad_analysis),
+        ("Job posting expired", selected_expired),
+        ("Sustainable company", selected_sustainable),
+    ):
+        if selected:
+            filter_mask &= _status_mask(masks, col, selected, n)
+
+    # Nothing left to narrow: skip the remaining blocks
+    if not filter_mask.any():
+        return filter_mask
 
     if selected_resume:
-        resume_mask = pd.Series([False] * len(df), index=df.index)
+        resume_mask = np.zeros(n, dtype=bool)
+        no_resume = ~df["_has_resume"].to_numpy()
         if "Yes" in selected_resume:
-            resume_mask = resume_mask | (
-                df["Tailored resume url"].notna() & (df["Tailored resume url"] != "")
-            )
+            np.logical_or(resume_mask, ~no_resume, out=resume_mask)
         if "No" in selected_resume or "Unknown" in selected_resume:
-            resume_mask = resume_mask | (
-                df["Tailored resume url"].isna() | (df["Tailored resume url"] == "")
-            )
-        filter_mask = filter_mask & resume_mask
+            np.logical_or(resume_mask, no_resume, out=resume_mask)
+        filter_mask &= resume_mask
 
     if selected_cl:
-        cl_mask = pd.Series([False] * len(df), index=df.index)
-        cl_col = "Tailored cover letter (to be humanized)"
+        cl_mask = np.zeros(n, dtype=bool)
+        no_cl = ~df["_has_cover_letter"].to_numpy()
         if "Yes" in selected_cl:
-            cl_mask = cl_mask | (df[cl_col].notna() & (df[cl_col] != ""))
+            np.logical_or(cl_mask, ~no_cl, out=cl_mask)
         if "No" in selected_cl or "Unknown" in selected_cl:
-            cl_mask = cl_mask | (df[cl_col].isna() | (df[cl_col] == ""))
-        filter_mask = filter_mask & cl_mask
+            np.logical_or(cl_mask, no_cl, out=cl_mask)
+        filter_mask &= cl_mask
+
+    if not filter_mask.any():
+        return filter_mask
 
     if selected_locations:
-        if "Unknown" in selected_locations:
-            location_mask = (
-                df["Location"].isna()
-                | (df["Location"] == "")
-                | df["Location"].isin([l for l in selected_locations if l != "Unknown"])
-            )
-        else:
-            location_mask = df["Location"].isin(selected_locations)
-        filter_mask = filter_mask & location_mask
+        filter_mask &= _in_or_unknown(df, "Location", selected_locations, masks["Location", "blank"])
 
     if selected_company:
-        if "Unknown" in selected_company:
-            company_mask = (
-                df["Company Name"].isna()
-                | (df["Company Name"] == "")
-                | df["Company Name"].isin([c for c in selected_company if c != "Unknown"])
-            )
-        else:
-            company_mask = df["Company Name"].isin(selected_company)
-        filter_mask = filter_mask & company_mask
-
-    has_jd = df["Job Description"].notna() & (df["Job Description"] != "")
-    has_co = (
-        (df["Company overview"].notna() & (df["Company overview"] != ""))
-        if "Company overview" in df.columns
-        else pd.Series([False] * len(df), index=df.index)
-    )
+        filter_mask &= _in_or_unknown(df, "Company Name", selected_company, masks["Company Name", "blank"])
+
+    has_jd = df["_has_jd"].to_numpy()
+    has_co = df["_has_co"].to_numpy()
 
     if selected_jd_data == "Has":
-        filter_mask = filter_mask & has_jd
+        filter_mask &= has_jd
     elif selected_jd_data == "Missing":
-        filter_mask = filter_mask & ~has_jd
+        filter_mask &= ~has_jd
 
     if selected_co_data == "Has":
-        filter_mask = filter_mask & has_co
+        filter_mask &= has_co
     elif selected_co_data == "Missing":
-        filter_mask = filter_mask & ~has_co
+        filter_mask &= ~has_co
 
     if show_priority_only:
-        is_sustainable = (
-            df["Sustainable company"] == "TRUE"
-            if "Sustainable company" in df.columns
-            else pd.Series([False] * len(df), index=df.index)
-        )
-        filter_mask = filter_mask & is_sustainable & ~has_jd
+        filter_mask &= masks["Sustainable company", "true"] & ~has_jd
+
+    return filter_mask
+
+
+def selections_key(selections: dict) -> tuple:
+    """Hashable form of the selections dict (lists become tuples)."""
+    return tuple(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(selections.items())
+    )
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def compute_filter_indices(
+    df_version: int, selections: tuple, _df: pd.DataFrame, _masks: dict | None = None
+) -> np.ndarray:
+    """Cached row positions kept by the filters, ready for df.take().
+    df_version stands in for the (unhashed) DataFrame in the key.
+    """
+    return np.flatnonzero(build_filter_mask(_df, dict(selections), _masks)).astype(np.int32)
+
+
+def filter_positions(df: pd.DataFrame, selections: dict, df_version: int) -> np.ndarray:
+    """Row positions of df kept by the filters, without materializing any rows."""
+    if not filters_active(selections):
+        return np.arange(len(df))  # Show-all: no mask to build
+    masks = None
+    if st.session_state.get("filter_options_version") == df_version:
+        # Built by ensure_filter_cache from this same df_version
+        masks = st.session_state.filter_options_cache.get("derived_masks")
+    return compute_filter_indices(df_version, selections_key(selections), df, masks)
 
-    return df[filter_mask].copy()
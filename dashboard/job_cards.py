@@ -1,15 +1,100 @@
 """Helpers for rendering individual job rows in the Jobs view."""
+import numpy as np
+import pandas as pd
 
 
-def get_row_value(row, col_name: str, column_index_map: dict, default: str = "") -> str:
-    """Get value from itertuples row using column index map.
-    itertuples(index=False) returns tuples where columns are in order.
+# Columns a job card reads (all in SHEET_HEADER, so always present on the loaded frame)
+CARD_COLUMNS = (
+    "Job URL",
+    "Company Name",
+    "Job Title",
+    "Location",
+    "Location Priority",
+    "Fit score",
+    "Tailored resume url",
+    "Resume feedback",
+    "Tailored cover letter (to be humanized)",
+    "CL feedback",
+    "Job Description",
+    "Company overview",
+    "Job analysis",
+    "Sustainable company",
+    "Sustainability keyword matches",
+    "Applied",
+    "Job posting expired",
+    "Bad analysis",
+)
+
+
+def _display_strings(col: pd.Series) -> np.ndarray:
+    """A column as display strings: missing -> "", booleans -> "TRUE"/"FALSE" (as stored in the DB)."""
+    if isinstance(col.dtype, pd.BooleanDtype):
+        flags = np.where(col.to_numpy(dtype=bool, na_value=False), "TRUE", "FALSE")
+        return np.where(col.isna().to_numpy(), "", flags).astype(object)
+    return col.astype("string").fillna("").to_numpy(dtype=object)
+
+
+def card_columns(page_df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """CARD_COLUMNS of a page as {column: object array of display strings}, converted column by column.
+    columns[col][i] is job i's value, with no per-cell type checks; cards index it only once open.
     """
-    if col_name not in column_index_map:
-        return default
-    col_idx = column_index_map[col_name]
-    try:
-        value = row[col_idx]
-        return str(value) if value is not None else default
-    except (IndexError, AttributeError, TypeError):
-        return default
+    return {col: _display_strings(page_df[col]) for col in CARD_COLUMNS}
+
+
+def job_ids(df: pd.DataFrame) -> np.ndarray:
+    """Per-row job ids (the DB row id index) used for hidden_jobs, the undo stack and widget keys."""
+    return df.index.to_numpy()
+
+
+_FIT_COLOR = {"Very good fit": "🟢", "Good fit": "🟡", "Poor fit": "🔴", "Very poor fit": "🔴"}
+
+
+def _text(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Column as an object array of str (missing -> ""), so + and np.where concatenate element-wise."""
+    return _display_strings(df[col])
+
+
+def _suffix(cond: np.ndarray, text) -> np.ndarray:
+    """" | text" where cond holds, "" elsewhere; text may be a str or a per-row array."""
+    return np.where(cond, " | " + text, "").astype(object)
+
+
+def job_card_meta(page_df: pd.DataFrame, show_sustainability: bool) -> pd.DataFrame:
+    """Expander titles plus the missing JD/CO flags for a page of jobs, computed column-wise.
+    Returned frame is aligned with page_df (same index, same row order).
+    """
+    fit = _text(page_df, "Fit score")
+    location = _text(page_df, "Location")
+    sustainable = page_df["Sustainable company"]
+    sus_true = sustainable.to_numpy(dtype=bool, na_value=False)
+    sus_false = ~sustainable.to_numpy(dtype=bool, na_value=True)
+    missing_jd = page_df["Job Description"].fillna("").str.strip().eq("").to_numpy(dtype=bool)
+    missing_co = page_df["Company overview"].fillna("").str.strip().eq("").to_numpy(dtype=bool)
+    # FALSE due only to missing CO is shown as Missing CO, not "Not Sustainable"
+    insufficient_co = page_df["Job analysis"].str.contains("Insufficient company overview", regex=False, na=False)
+    unsustainable_no_co = sus_false & (missing_co | insufficient_co.to_numpy(dtype=bool))
+
+    color = np.array([_FIT_COLOR.get(f, "⚪") for f in fit], dtype=object)
+    title = color + " " + _text(page_df, "Company Name") + " - " + _text(page_df, "Job Title")
+    title += _suffix(location != "", "📍 " + location)
+    title += _suffix((fit != "") & (fit != "Unknown"), "⭐ " + fit)
+    if show_sustainability:
+        title += _suffix(sus_true, "🌱 Sustainable")
+        title += _suffix(sus_false & ~unsustainable_no_co, "⚠️ Not Sustainable")
+    title += _suffix(page_df["Applied"].to_numpy(dtype=bool, na_value=False), "✅ Applied")
+    title += _suffix(page_df["Job posting expired"].to_numpy(dtype=bool, na_value=False), "❌ Expired")
+    # Sustainable jobs without a JD get a leading red marker instead of the trailing label
+    jd_marker = missing_jd & sus_true if show_sustainability else np.zeros(len(page_df), dtype=bool)
+    title += _suffix(missing_jd & ~jd_marker, "⚠️ Missing JD")
+    title += _suffix(missing_co, "⚠️ Missing CO")
+    title = np.where(jd_marker, "🔴⚠️ | ", "").astype(object) + title
+
+    return pd.DataFrame(
+        {
+            "title": title,
+            "missing_jd": missing_jd,
+            "missing_co": missing_co,
+            "unsustainable_no_co": unsustainable_no_co,
+        },
+        index=page_df.index,
+    )
@@ -1,40 +1,127 @@
 """Jobs view: list, filters, sorting, pagination, job cards, undo popup."""
-import base64
+import functools
 import time
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from config import _get_job_filters
 from .constants import (
     AUTO_REFRESH_INTERVAL,
-    MAX_PDF_CACHE_SIZE,
+    MAX_PDF_PREVIEW_BYTES,
     PAGE_SIZE,
     UNDO_POPUP_TIMEOUT,
 )
 from .data import (
+    bump_df_version,
+    db_mtime_ns,
+    flag_to_bool,
     get_check_sustainability,
+    get_job_filters,
+    get_pdf_base64,
+    get_resume_file_info,
     handle_field_update,
     load_job_data,
     open_file_manager,
-    get_resume_path,
-    update_job_field,
+    queue_job_update,
+    set_session_cell_by_id,
+    set_session_df,
 )
 from .filters import (
     FILTER_KEYS,
     JD_FILTER_OPTIONS,
-    apply_filter_mask,
     ensure_filter_cache,
+    filter_positions,
+    mark_pagination_dirty,
     render_sidebar_filters,
+    selections_key,
 )
-from .job_cards import get_row_value
+from .job_cards import card_columns, job_card_meta, job_ids
+from .styles import undo_timer_js
+
+
+# Sort option -> DataFrame columns to sort by, first one present wins ("None" has no entry)
+SORT_COLUMN_CANDIDATES = {
+    "Location Priority": ("Location Priority",),
+    "Fit Score": ("Fit score enum", "Fit score"),
+    "Company": ("Company Name",),
+    "Location": ("Location",),
+}
+
+# Status column -> how the undo popup names it
+_FIELD_DISPLAY = {
+    "Applied": "Applied",
+    "Job posting expired": "Expired",
+    "Bad analysis": "Bad Analysis",
+    "Sustainable company": "Sustainable",
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _sustain_state(sustainable: str, unsustainable_no_co: bool, missing_co: bool) -> tuple[str, str]:
+    """(icon, label) for the Sustainable Company detail line; only a handful of inputs exist."""
+    if sustainable == "TRUE":
+        return "✅", sustainable
+    if unsustainable_no_co:
+        return "⚠️", "Missing overview (not evaluated)"
+    if sustainable.strip() not in ("TRUE", "FALSE"):
+        return "⚠️", "Missing overview (not evaluated)" if missing_co else "Unknown"
+    return "❌", sustainable
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _sort_positions(
+    df_version: int,
+    selections: tuple,
+    hidden: tuple,
+    sort_columns: tuple,
+    sort_ascending: tuple,
+    _sort_keys: pd.DataFrame,
+) -> np.ndarray:
+    """Row positions of _sort_keys in sorted order. The first three args stand in for the
+    (unhashed) DataFrame in the cache key: same data, filters and hidden jobs -> same rows.
+    """
+    ordered = _sort_keys.sort_values(list(sort_columns), ascending=list(sort_ascending))
+    return _sort_keys.index.get_indexer(ordered.index)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _sidebar_stats(
+    df_version: int,
+    selections: tuple,
+    check_sustainability_enabled: bool,
+    _df: pd.DataFrame,
+    _rows: np.ndarray,
+) -> dict:
+    """All sidebar counts for the filtered rows of _df in one pass.
+    df_version and selections stand in for the (unhashed) frame and row positions in the cache key.
+    """
+    stats = {
+        "with_resume": int(_df["_has_resume"].to_numpy()[_rows].sum()),
+        "applied": int(_df["Applied"].to_numpy(dtype=bool, na_value=False)[_rows].sum()),
+    }
+    if check_sustainability_enabled:
+        sustainable = _df["Sustainable company"]
+        stats["sustainable"] = int(sustainable.to_numpy(dtype=bool, na_value=False)[_rows].sum())
+        stats["not_sustainable"] = int((~sustainable.to_numpy(dtype=bool, na_value=True))[_rows].sum())
+    # Blank and missing scores are both counted as Unknown
+    fit_scores = []
+    unknown_fit = 0
+    for score, count in _df["Fit score"].take(_rows).value_counts(dropna=False).items():
+        if pd.isna(score) or score == "":
+            unknown_fit += int(count)
+        elif count:
+            fit_scores.append((score, int(count)))
+    stats["fit_scores"] = tuple(fit_scores)
+    stats["unknown_fit"] = unknown_fit
+    return stats
 
 
 def _init_jobs_session_state() -> None:
     """Initialize session state keys for the Jobs view (including filter migration)."""
-    if "hidden_jobs" not in st.session_state:
-        st.session_state.hidden_jobs = set()
+    if not isinstance(st.session_state.get("hidden_jobs"), set):
+        st.session_state.hidden_jobs = set(st.session_state.get("hidden_jobs") or ())
     if "undo_stack" not in st.session_state:
         st.session_state.undo_stack = []
     if "undo_stack_timestamp" not in st.session_state:
@@ -43,8 +130,10 @@ def _init_jobs_session_state() -> None:
         st.session_state.page_index = 0
     if "page_jump" not in st.session_state:
         st.session_state.page_jump = 1
-    if "pagination_context_hash" not in st.session_state:
-        st.session_state.pagination_context_hash = None
+    if "pagination_guard" not in st.session_state:
+        st.session_state.pagination_guard = None
+    if "df_version" not in st.session_state:
+        bump_df_version()
 
     # Restore all filters after refresh so cleared/default state is never overwritten
     if "_preserve_filters" in st.session_state:
@@ -93,62 +182,430 @@ def _init_jobs_session_state() -> None:
         st.session_state.filter_priority_only = False
 
 
+def _on_checkbox_change(
+    job_key, field_name, job_url_key, company_key, current_val, filter_selection
+):
+    key = f"{field_name.lower().replace(' ', '_')}_{job_key}"
+    if key not in st.session_state:
+        return
+    new_val = st.session_state[key]
+    if new_val == (current_val == "TRUE"):
+        return  # Same value as rendered: no DB write, no frame edit, nothing to hide
+    # The card title shows these flags, so the keyed expander is rebuilt; keep it open like a save does
+    st.session_state.expanded_job_row = job_key
+    queue_job_update(job_url_key, company_key, field_name, "TRUE" if new_val else "FALSE")
+    # job_key is the row id, so the session frame is written without a key lookup
+    set_session_cell_by_id(job_key, field_name, bool(new_val))
+
+    should_hide = False
+    if field_name == "Applied":
+        if not new_val and filter_selection and "Not Applied" not in filter_selection and "Unknown" not in filter_selection:
+            should_hide = True
+        elif new_val and filter_selection and "Applied" not in filter_selection:
+            should_hide = True
+    elif field_name == "Job posting expired":
+        if new_val and filter_selection and "Expired" not in filter_selection:
+            should_hide = True
+        elif not new_val and filter_selection and "Active" not in filter_selection and "Unknown" not in filter_selection:
+            should_hide = True
+    elif field_name == "Bad analysis":
+        if new_val and filter_selection and "Yes" not in filter_selection:
+            should_hide = True
+        elif not new_val and filter_selection and "No" not in filter_selection and "Unknown" not in filter_selection:
+            should_hide = True
+    elif field_name == "Sustainable company":
+        if new_val and filter_selection and "Yes" not in filter_selection:
+            should_hide = True
+        elif not new_val and filter_selection and "No" not in filter_selection and "Unknown" not in filter_selection:
+            should_hide = True
+
+    if should_hide:
+        st.session_state.hidden_jobs.add(job_key)
+        st.session_state.undo_stack.append((job_key, field_name, current_val))
+        st.session_state.undo_stack_timestamp = time.time()
+
+
+def _ensure_text_area_state(key: str, current: str) -> None:
+    """Seed a keyed text_area with the stored value and keep it in sync with later changes.
+
+    `<key>__loaded` remembers the value the widget was last seeded with: the widget follows
+    the stored value only while the user has not edited it, so unsaved input is never clobbered.
+    """
+    ss = st.session_state
+    loaded_key = f"{key}__loaded"
+    last_loaded = ss.setdefault(loaded_key, current)
+    if ss.setdefault(key, current) == last_loaded and current != last_loaded:
+        ss[key] = current
+    ss[loaded_key] = current
+
+
+@st.fragment
+def _render_job_card(
+    job_key: int,
+    card,
+    page_cols: dict,
+    i: int,
+    selections: dict,
+    check_sustainability_enabled: bool,
+    has_location_priorities: bool,
+    df_version: int,
+) -> None:
+    """One job card: its expander and, while open, the body. As a fragment, opening the card or
+    using its widgets reruns only this card; an edit that moved df_version reruns the whole page.
+    """
+    if st.session_state.df_version != df_version:
+        st.rerun()  # Counts, hidden jobs and the other cards must reflect the edit
+    selected_applied = selections["selected_applied"]
+    selected_expired = selections["selected_expired"]
+    selected_bad_analysis = selections.get("selected_bad_analysis") or []
+    selected_sustainable = selections.get("selected_sustainable") or []
+
+    expanded = job_key == st.session_state.get("expanded_job_row")
+    # Tracked expander: the card body (forms, text areas, PDF preview) only runs while it is open
+    job_expander = st.expander(
+        card.title, expanded=expanded, key=f"job_card_{job_key}", on_change="rerun"
+    )
+    if not job_expander.open:
+        return
+    # Closed cards never get here, so only open ones gather their fields from the page columns
+    r = {col: values[i] for col, values in page_cols.items()}
+    job_url_key = r["Job URL"]
+    company_key = r["Company Name"]
+
+    def _ck_args(field_name: str, current: bool, filter_selection) -> tuple:
+        # on_change args for this card's checkboxes; only the field and its state differ
+        return (job_key, field_name, job_url_key, company_key, "TRUE" if current else "FALSE", filter_selection)
+
+    fit_score = r["Fit score"] or "Unknown"
+    company = r["Company Name"]
+    job_title = r["Job Title"]
+    location = r["Location"]
+    location_priority = r["Location Priority"]
+    resume_url = r["Tailored resume url"]
+    job_url = r["Job URL"]
+    company_overview = r["Company overview"]
+    sustainable = r["Sustainable company"]
+    job_analysis = r["Job analysis"]
+    has_bad_analysis = r["Bad analysis"] == "TRUE"
+    job_description = r["Job Description"]
+    missing_jd = card.missing_jd
+    missing_co = card.missing_co
+    has_job_description = not missing_jd
+    unsustainable_no_co = card.unsustainable_no_co
+    applied = r["Applied"]
+    expired = r["Job posting expired"]
+    cover_letter = r["Tailored cover letter (to be humanized)"]
+
+    # Show "Apply" at top only when fit is at least moderate; otherwise same fields live in Job details
+    show_apply_at_top = fit_score in ("Moderate fit", "Good fit", "Very good fit")
+    with job_expander:
+        if show_apply_at_top:
+            st.subheader("🔗 Apply")
+            if job_url:
+                url_col1, url_col2 = st.columns([3, 1])
+                with url_col1:
+                    st.write(f"**Job URL:** [{job_url}]({job_url})")
+                with url_col2:
+                    current_expired = expired == "TRUE"
+                    st.checkbox(
+                        "Expired",
+                        value=current_expired,
+                        key=f"job_posting_expired_{job_key}",
+                        on_change=_on_checkbox_change,
+                        args=_ck_args("Job posting expired", current_expired, selected_expired),
+                    )
+            current_applied = applied == "TRUE"
+            st.checkbox(
+                "✅ Applied",
+                value=current_applied,
+                key=f"applied_{job_key}",
+                on_change=_on_checkbox_change,
+                args=_ck_args("Applied", current_applied, selected_applied),
+            )
+            st.divider()
+
+        if resume_url:
+            st.subheader("📄 Tailored Resume")
+            resume_info = get_resume_file_info(resume_url)
+            if resume_info:
+                resume_path, file_size, file_mtime_ts = resume_info
+                st.write(f"**Path:** `{resume_path}`")
+                file_mtime = datetime.fromtimestamp(file_mtime_ts)
+                st.caption(
+                    f"File size: {file_size:,} bytes | Modified: {file_mtime.strftime('%Y-%m-%d %H:%M:%S')}"
+                )
+                pdf_expander = st.expander(
+                    "📄 Preview Resume PDF", expanded=False, key=f"pdf_preview_{job_key}", on_change="rerun"
+                )
+                # Read and encode the PDF only while the preview is open
+                with pdf_expander:
+                    if pdf_expander.open:
+                        base64_pdf = None
+                        if file_size > MAX_PDF_PREVIEW_BYTES:
+                            st.caption("PDF is too large for an inline preview; download it instead.")
+                        else:
+                            try:
+                                base64_pdf = get_pdf_base64(str(resume_path), file_mtime_ts)
+                            except Exception as e:
+                                st.warning(f"Could not encode PDF: {e}")
+                        if base64_pdf:
+                            pdf_display = f'''
+                            <iframe src="data:application/pdf;base64,{base64_pdf}"
+                                    width="700" height="900" type="application/pdf"
+                                    style="border: 1px solid #ccc;">
+                            </iframe>
+                            '''
+                            st.components.v1.html(pdf_display, height=920)
+                        else:
+                            try:
+                                with open(resume_path, "rb") as f:
+                                    st.download_button(
+                                        label="Download Resume PDF",
+                                        data=f.read(),
+                                        file_name=resume_path.name,
+                                        mime_type="application/pdf",
+                                    )
+                            except Exception as download_error:
+                                st.error(f"Could not read PDF file: {download_error}")
+                if st.button(f"📂 Open in File Manager", key=f"open_{job_key}"):
+                    open_file_manager(resume_path)
+                    st.success(f"Opened file manager at: {resume_path.parent}")
+
+                current_resume_feedback = r["Resume feedback"]
+                rf_key = f"resume_feedback_{job_key}"
+                _ensure_text_area_state(rf_key, current_resume_feedback)
+                st.text_area("Resume Feedback", key=rf_key, height=100)
+                if st.button("💾 Save Resume Feedback", key=f"save_resume_feedback_{job_key}"):
+                    st.session_state.expanded_job_row = job_key
+                    st.session_state.last_refresh = time.time()
+                    handle_field_update(
+                        job_url_key,
+                        company_key,
+                        "Resume feedback",
+                        st.session_state.get(rf_key, ""),
+                        current_resume_feedback,
+                        "✅ Resume feedback saved",
+                    )
+            else:
+                st.warning(f"Resume file not found at: {resume_url}")
+
+        if cover_letter:
+            st.divider()
+            st.subheader("📝 Cover Letter")
+            with st.expander("View/Edit Cover Letter"):
+                current_cl_feedback = r["CL feedback"]
+                st.text_area(
+                    "Current Cover Letter",
+                    value=cover_letter,
+                    height=400,
+                    key=f"cl_view_{job_key}",
+                    disabled=True,
+                )
+                cf_key = f"cl_feedback_{job_key}"
+                _ensure_text_area_state(cf_key, current_cl_feedback)
+                st.text_area("Cover Letter Feedback", key=cf_key, height=100)
+                if st.button("💾 Save CL Feedback", key=f"save_cl_feedback_{job_key}"):
+                    st.session_state.expanded_job_row = job_key
+                    st.session_state.last_refresh = time.time()
+                    handle_field_update(
+                        job_url_key,
+                        company_key,
+                        "CL feedback",
+                        st.session_state.get(cf_key, ""),
+                        current_cl_feedback,
+                        "✅ Cover letter feedback saved",
+                    )
+
+        st.divider()
+        st.subheader("📌 Job details")
+        if not show_apply_at_top:
+            if job_url:
+                url_col1, url_col2 = st.columns([3, 1])
+                with url_col1:
+                    st.write(f"**Job URL:** [{job_url}]({job_url})")
+                with url_col2:
+                    _current_expired = expired == "TRUE"
+                    st.checkbox(
+                        "Expired",
+                        value=_current_expired,
+                        key=f"job_posting_expired_{job_key}",
+                        on_change=_on_checkbox_change,
+                        args=_ck_args("Job posting expired", _current_expired, selected_expired),
+                    )
+            _current_applied = applied == "TRUE"
+            st.checkbox(
+                "✅ Applied",
+                value=_current_applied,
+                key=f"applied_{job_key}",
+                on_change=_on_checkbox_change,
+                args=_ck_args("Applied", _current_applied, selected_applied),
+            )
+        # Read-only details go out as one markdown element, one paragraph per field
+        details = [
+            f"**Company:** {company}",
+            f"**Job Title:** {job_title}",
+            f"**Location:** {location}",
+        ]
+        if has_location_priorities and location_priority:
+            details.append(f"**Location Priority:** {location_priority}")
+        if fit_score != "Unknown":
+            details.append(f"**Fit Score:** {fit_score}")
+        if check_sustainability_enabled:
+            sustainable_icon, sustainable_label = _sustain_state(
+                sustainable or "", bool(unsustainable_no_co), bool(missing_co)
+            )
+            details.append(f"**Sustainable Company:** {sustainable_icon} {sustainable_label}")
+        st.markdown("\n\n".join(details))
+        if check_sustainability_enabled:
+            current_sustainable = sustainable == "TRUE"
+            st.checkbox(
+                "🌱 Mark as sustainable company",
+                value=current_sustainable,
+                key=f"sustainable_company_{job_key}",
+                on_change=_on_checkbox_change,
+                args=_ck_args("Sustainable company", current_sustainable, selected_sustainable),
+            )
+        if check_sustainability_enabled:
+            sust_kw = r["Sustainability keyword matches"].strip()
+            if sust_kw:
+                st.write(f"**Sustainability keyword matches:** {sust_kw}")
+        st.divider()
+        if job_analysis:
+            analysis_col1, analysis_col2 = st.columns([3, 1])
+            with analysis_col1:
+                with st.expander("Job Analysis"):
+                    st.markdown(job_analysis)
+            with analysis_col2:
+                st.checkbox(
+                    "Bad Analysis",
+                    value=has_bad_analysis,
+                    key=f"bad_analysis_{job_key}",
+                    on_change=_on_checkbox_change,
+                    args=_ck_args("Bad analysis", has_bad_analysis, selected_bad_analysis),
+                )
+
+        st.divider()
+        st.subheader("📋 Job Description")
+        if has_job_description:
+            jd_expander = st.expander(
+                "View/Edit Job Description", key=f"jd_editor_{job_key}", on_change="rerun"
+            )
+            # The full description only goes out in a text area while the editor is open
+            with jd_expander:
+                if jd_expander.open:
+                    current_jd = job_description or ""
+                    jd_key = f"job_description_{job_key}"
+                    _ensure_text_area_state(jd_key, current_jd)
+                    st.text_area("Job Description", key=jd_key, height=300)
+                    if st.button("💾 Save Job Description", key=f"save_job_description_{job_key}"):
+                        st.session_state.expanded_job_row = job_key
+                        st.session_state.last_refresh = time.time()
+                        handle_field_update(
+                            job_url_key,
+                            company_key,
+                            "Job Description",
+                            st.session_state.get(jd_key, ""),
+                            current_jd,
+                            "✅ Job description saved!",
+                        )
+        else:
+            if check_sustainability_enabled and sustainable == "TRUE":
+                st.error(
+                    "🚨 **CRITICAL: Missing Job Description** - This sustainable company job cannot be analyzed without a job description!"
+                )
+            else:
+                st.warning(
+                    "⚠️ **Missing Job Description** - This job cannot be analyzed without a job description."
+                )
+            st.subheader("✏️ Add Job Description")
+            current_jd = job_description or ""
+            jd_key = f"job_description_{job_key}"
+            _ensure_text_area_state(jd_key, current_jd)
+            st.text_area(
+                "Job Description",
+                key=jd_key,
+                height=300,
+                help="Paste the job description from the LinkedIn job posting here",
+            )
+            if st.button("💾 Save Job Description", key=f"save_job_description_missing_{job_key}"):
+                st.session_state.expanded_job_row = job_key
+                st.session_state.last_refresh = time.time()
+                handle_field_update(
+                    job_url_key,
+                    company_key,
+                    "Job Description",
+                    st.session_state.get(jd_key, ""),
+                    current_jd,
+                    "✅ Job description saved! The job will be analyzed in the next cycle.",
+                )
+
+        st.divider()
+        st.subheader("🏢 Company Overview")
+        if company_overview:
+            co_expander = st.expander(
+                "View/Edit Company Overview", key=f"co_editor_{job_key}", on_change="rerun"
+            )
+            with co_expander:
+                if co_expander.open:
+                    current_co = company_overview
+                    co_key = f"company_overview_{job_key}"
+                    _ensure_text_area_state(co_key, current_co)
+                    st.text_area("Company Overview", key=co_key, height=200)
+                    if st.button("💾 Save Company Overview", key=f"save_company_overview_{job_key}"):
+                        st.session_state.expanded_job_row = job_key
+                        st.session_state.last_refresh = time.time()
+                        handle_field_update(
+                            job_url_key,
+                            company_key,
+                            "Company overview",
+                            st.session_state.get(co_key, ""),
+                            current_co,
+                            "✅ Company overview saved!",
+                        )
+        else:
+            st.warning(
+                "⚠️ **Missing Company Overview** - Company overview is needed for sustainability checks and better analysis."
+            )
+            st.subheader("✏️ Add Company Overview")
+            current_co = company_overview
+            co_key = f"company_overview_{job_key}"
+            _ensure_text_area_state(co_key, current_co)
+            st.text_area(
+                "Company Overview",
+                key=co_key,
+                height=200,
+                help="Paste the company overview/description here",
+            )
+            if st.button("💾 Save Company Overview", key=f"save_company_overview_missing_{job_key}"):
+                st.session_state.expanded_job_row = job_key
+                st.session_state.last_refresh = time.time()
+                handle_field_update(
+                    job_url_key,
+                    company_key,
+                    "Company overview",
+                    st.session_state.get(co_key, ""),
+                    current_co,
+                    "✅ Company overview saved!",
+                )
+
+
 def render_jobs_view() -> None:
     """Render the Jobs view: data, filters, sorting, pagination, job cards, undo, pager."""
     _init_jobs_session_state()
 
-    def on_checkbox_change(
-        job_key, field_name, job_url_key, company_key, company, job_title, current_val, filter_selection
-    ):
-        key = f"{field_name.lower().replace(' ', '_')}_{job_key}"
-        if key not in st.session_state:
-            return
-        new_val = st.session_state[key]
-        update_job_field(job_url_key, company_key, field_name, "TRUE" if new_val else "FALSE")
-        df = st.session_state.df
-        mask = (df.get("Job URL", "") == job_url_key) & (df.get("Company Name", "") == company_key)
-        df.loc[mask, field_name] = "TRUE" if new_val else "FALSE"
-        st.session_state.df = df
-
-        should_hide = False
-        if field_name == "Applied":
-            if not new_val and filter_selection and "Not Applied" not in filter_selection and "Unknown" not in filter_selection:
-                should_hide = True
-            elif new_val and filter_selection and "Applied" not in filter_selection:
-                should_hide = True
-        elif field_name == "Job posting expired":
-            if new_val and filter_selection and "Expired" not in filter_selection:
-                should_hide = True
-            elif not new_val and filter_selection and "Active" not in filter_selection and "Unknown" not in filter_selection:
-                should_hide = True
-        elif field_name == "Bad analysis":
-            if new_val and filter_selection and "Yes" not in filter_selection:
-                should_hide = True
-            elif not new_val and filter_selection and "No" not in filter_selection and "Unknown" not in filter_selection:
-                should_hide = True
-        elif field_name == "Sustainable company":
-            if new_val and filter_selection and "Yes" not in filter_selection:
-                should_hide = True
-            elif not new_val and filter_selection and "No" not in filter_selection and "Unknown" not in filter_selection:
-                should_hide = True
-
-        if should_hide:
-            st.session_state.hidden_jobs.add(job_key)
-            st.session_state.undo_stack.append(
-                (job_key, field_name, current_val, job_url_key, company_key, company, job_title)
-            )
-            st.session_state.undo_stack_timestamp = time.time()
-
     def handle_undo():
         if st.session_state.undo_stack:
-            job_key, field_name, old_value, job_url_key, company_key, company, job_title = (
-                st.session_state.undo_stack.pop()
-            )
-            update_job_field(job_url_key, company_key, field_name, old_value)
+            job_key, field_name, old_value = st.session_state.undo_stack.pop()
             df = st.session_state.df
-            mask = (df.get("Job URL", "") == job_url_key) & (df.get("Company Name", "") == company_key)
-            df.loc[mask, field_name] = old_value
-            st.session_state.df = df
+            if df is not None and job_key in df.index:
+                restored = flag_to_bool(old_value)
+                current = df.at[job_key, field_name]
+                # Skip the write when the cell already holds the old value (e.g. undo after a re-toggle)
+                if pd.isna(current) or pd.isna(restored) or current != restored:
+                    job_url_key = df.at[job_key, "Job URL"]
+                    company_key = str(df.at[job_key, "Company Name"])
+                    queue_job_update(job_url_key, company_key, field_name, old_value)
+                    set_session_cell_by_id(job_key, field_name, restored)
             st.session_state.hidden_jobs.discard(job_key)
             if not st.session_state.undo_stack:
                 st.session_state.undo_stack_timestamp = None
@@ -160,7 +617,9 @@ def render_jobs_view() -> None:
     with col_header2:
         if st.button("🔄 Refresh", use_container_width=True):
             st.cache_data.clear()
-            st.session_state.df, error = load_job_data()
+            st.session_state.df_mtime_ns = db_mtime_ns()
+            df, error = load_job_data()
+            set_session_df(df)
             if error:
                 st.error(error)
             # Preserve all filter state across rerun so current filters (including cleared) are kept
@@ -178,10 +637,6 @@ def render_jobs_view() -> None:
                         st.session_state._preserve_filters[k] = False
                     else:
                         st.session_state._preserve_filters[k] = []
-            if "filter_options_cache" in st.session_state:
-                del st.session_state.filter_options_cache
-            if "df_hash" in st.session_state:
-                del st.session_state.df_hash
             st.rerun()
     with col_header3:
         auto_refresh = st.checkbox("Auto-refresh", value=True, key="jobs_auto_refresh")
@@ -201,215 +656,157 @@ def render_jobs_view() -> None:
         )
         if current_time - st.session_state.last_refresh > refresh_interval:
             st.session_state.last_refresh = current_time
-            st.cache_data.clear()
-            st.session_state.df, error = load_job_data()
-            if error:
-                st.error(f"Auto-refresh error: {error}")
-            else:
-                st.rerun()
+            mtime_ns = db_mtime_ns()
+            if mtime_ns != st.session_state.get("df_mtime_ns"):
+                st.session_state.df_mtime_ns = mtime_ns
+                df, error = load_job_data()
+                current_df = st.session_state.df
+                if error:
+                    set_session_df(df)
+                    st.error(f"Auto-refresh error: {error}")
+                elif current_df is None or not df.equals(current_df):
+                    set_session_df(df)
+                    st.rerun()
+                # else: the write was our own edit, already applied in place; keep df_version
 
     df = st.session_state.df
     if df is None or df.empty:
         st.info("No jobs found.")
         return
 
-    if "pdf_cache_keys" not in st.session_state:
-        st.session_state.pdf_cache_keys = []
-
-    filters_config = _get_job_filters()
+    filters_config = get_job_filters()
     has_location_priorities = bool(filters_config.get("location_priorities", {}))
     check_sustainability_enabled = get_check_sustainability()
 
-    ensure_filter_cache(df)
+    ensure_filter_cache(df, st.session_state.df_version)
     selections = render_sidebar_filters(df, check_sustainability_enabled)
-    filtered_df = apply_filter_mask(df, selections)
-
-    # Sidebar stats
+    # Filtering, hiding and sorting all work on row positions into df; only the page is taken
+    rows = filter_positions(df, selections, st.session_state.df_version)
+    n_filtered = len(rows)
+
+    stats = _sidebar_stats(
+        st.session_state.df_version,
+        selections_key(selections),
+        check_sustainability_enabled,
+        df,
+        rows,
+    )
     st.sidebar.divider()
     st.sidebar.header("📊 Statistics")
-    st.sidebar.metric("Total Jobs", len(filtered_df))
-    if "Tailored resume url" in filtered_df.columns:
-        with_resumes = len(
-            filtered_df[
-                filtered_df["Tailored resume url"].notna()
-                & (filtered_df["Tailored resume url"] != "")
-            ]
-        )
-        st.sidebar.metric("With Resumes", with_resumes)
-    else:
-        st.sidebar.metric("With Resumes", 0)
-    if "Applied" in filtered_df.columns:
-        applied_count = len(filtered_df[filtered_df["Applied"] == "TRUE"])
-        st.sidebar.metric("Applied", applied_count)
-    else:
-        st.sidebar.metric("Applied", 0)
-    if check_sustainability_enabled and "Sustainable company" in df.columns:
+    st.sidebar.metric("Total Jobs", n_filtered)
+    st.sidebar.metric("With Resumes", stats["with_resume"])
+    st.sidebar.metric("Applied", stats["applied"])
+    if check_sustainability_enabled:
+        n_sustainable = stats["sustainable"]
+        n_not_sustainable = stats["not_sustainable"]
         st.sidebar.divider()
         st.sidebar.header("🌱 Sustainability")
-        st.sidebar.metric(
-            "✅ Sustainable",
-            len(filtered_df[filtered_df["Sustainable company"] == "TRUE"]),
-        )
-        st.sidebar.metric(
-            "❌ Not Sustainable",
-            len(filtered_df[filtered_df["Sustainable company"] == "FALSE"]),
-        )
-        st.sidebar.metric(
-            "❓ Unknown",
-            len(
-                filtered_df[
-                    filtered_df["Sustainable company"].isna()
-                    | (filtered_df["Sustainable company"] == "")
-                ]
-            ),
-        )
-    if len(filtered_df) > 0:
+        st.sidebar.metric("✅ Sustainable", n_sustainable)
+        st.sidebar.metric("❌ Not Sustainable", n_not_sustainable)
+        st.sidebar.metric("❓ Unknown", n_filtered - n_sustainable - n_not_sustainable)
+    if n_filtered > 0:
         st.sidebar.divider()
         st.sidebar.header("⭐ Fit Score Breakdown")
-        fit_breakdown = filtered_df["Fit score"].value_counts()
-        for score, count in fit_breakdown.items():
-            if score:
-                st.sidebar.text(f"{score}: {count}")
-        unknown_fit = len(
-            filtered_df[filtered_df["Fit score"].isna() | (filtered_df["Fit score"] == "")]
+        for score, count in stats["fit_scores"]:
+            st.sidebar.text(f"{score}: {count}")
+        if stats["unknown_fit"] > 0:
+            st.sidebar.text(f"Unknown: {stats['unknown_fit']}")
+
+    # Versions that key the dashboard caches; if these don't move after an edit, the view is stale
+    with st.sidebar.expander("🛠️ Debug", expanded=False):
+        st.json(
+            {
+                "df_version": st.session_state.df_version,
+                "filter_options_version": st.session_state.get("filter_options_version"),
+                "db_mtime_ns": st.session_state.get("df_mtime_ns"),
+                "rows_loaded": len(df),
+                "rows_filtered": n_filtered,
+                "hidden_jobs": len(st.session_state.hidden_jobs),
+                "pending_updates": len(st.session_state.get("pending_updates") or ()),
+            }
         )
-        if unknown_fit > 0:
-            st.sidebar.text(f"Unknown: {unknown_fit}")
 
-    column_index_map = {col: idx for idx, col in enumerate(filtered_df.columns)}
-
-    def _get(row, col: str, default: str = ""):
-        return get_row_value(row, col, column_index_map, default)
-
-    visible_count = 0
-    for row_idx, row in enumerate(filtered_df.itertuples(index=False)):
-        job_key = f"{_get(row, 'Job URL', '')}|{_get(row, 'Company Name', '')}|{row_idx}"
-        if job_key not in st.session_state.hidden_jobs:
-            visible_count += 1
-    st.header(f"Job Listings ({visible_count} jobs)")
+    # Drop jobs hidden by a checkbox (until undo) once, before sorting; everything below is visible
+    hidden = st.session_state.hidden_jobs
+    hidden_arr = np.fromiter(hidden, dtype=np.int64, count=len(hidden))
+    if len(hidden_arr):
+        rows = rows[~np.isin(job_ids(df)[rows], hidden_arr)]
+    st.header(f"Job Listings ({len(rows)} jobs)")
 
     # Sorting
     st.subheader("Sorting")
-    col_sort1, col_sort2, col_sort3 = st.columns(3)
-    with col_sort1:
-        sort_by_1 = st.selectbox(
-            "Primary Sort",
-            ["Location Priority", "Fit Score", "Company", "Location"],
-            key="sort_by_1",
-            index=0,
-        )
-        sort_order_1 = st.selectbox("Order", ["Descending", "Ascending"], key="sort_order_1", index=0)
-    with col_sort2:
-        sort_by_2 = st.selectbox(
-            "Secondary Sort",
-            ["Fit Score", "Location Priority", "Company", "Location"],
-            key="sort_by_2",
-            index=0,
-        )
-        sort_order_2 = st.selectbox("Order", ["Descending", "Ascending"], key="sort_order_2", index=0)
-    with col_sort3:
-        sort_by_3 = st.selectbox(
-            "Tertiary Sort",
-            ["None", "Company", "Location", "Fit Score", "Location Priority"],
-            key="sort_by_3",
-            index=0,
-        )
-        sort_order_3 = st.selectbox("Order", ["Descending", "Ascending"], key="sort_order_3", index=0)
+    # A form: picking several sort keys and orders costs one rerun, on "Apply Sort"
+    with st.form("sort_form", border=False):
+        col_sort1, col_sort2, col_sort3 = st.columns(3)
+        with col_sort1:
+            sort_by_1 = st.selectbox(
+                "Primary Sort",
+                ["Location Priority", "Fit Score", "Company", "Location"],
+                key="sort_by_1",
+                index=0,
+            )
+            sort_order_1 = st.selectbox("Order", ["Descending", "Ascending"], key="sort_order_1", index=0)
+        with col_sort2:
+            sort_by_2 = st.selectbox(
+                "Secondary Sort",
+                ["Fit Score", "Location Priority", "Company", "Location"],
+                key="sort_by_2",
+                index=0,
+            )
+            sort_order_2 = st.selectbox("Order", ["Descending", "Ascending"], key="sort_order_2", index=0)
+        with col_sort3:
+            sort_by_3 = st.selectbox(
+                "Tertiary Sort",
+                ["None", "Company", "Location", "Fit Score", "Location Priority"],
+                key="sort_by_3",
+                index=0,
+            )
+            sort_order_3 = st.selectbox("Order", ["Descending", "Ascending"], key="sort_order_3", index=0)
+        st.form_submit_button("Apply Sort", on_click=mark_pagination_dirty)
 
     sort_columns = []
     sort_ascending = []
-
-    if sort_by_1 == "Location Priority" and "Location Priority" in filtered_df.columns:
-        sort_columns.append("Location Priority")
-        sort_ascending.append(sort_order_1 == "Ascending")
-    elif sort_by_1 == "Fit Score":
-        if "Fit score enum" in filtered_df.columns:
-            sort_columns.append("Fit score enum")
-            sort_ascending.append(sort_order_1 == "Ascending")
-        elif "Fit score" in filtered_df.columns:
-            sort_columns.append("Fit score")
-            sort_ascending.append(sort_order_1 == "Ascending")
-    elif sort_by_1 == "Company":
-        sort_columns.append("Company Name")
-        sort_ascending.append(sort_order_1 == "Ascending")
-    elif sort_by_1 == "Location":
-        sort_columns.append("Location")
-        sort_ascending.append(sort_order_1 == "Ascending")
-
-    if sort_by_2 != sort_by_1 and sort_by_2 != "None":
-        if sort_by_2 == "Location Priority" and "Location Priority" in filtered_df.columns:
-            sort_columns.append("Location Priority")
-            sort_ascending.append(sort_order_2 == "Ascending")
-        elif sort_by_2 == "Fit Score":
-            if "Fit score enum" in filtered_df.columns:
-                sort_columns.append("Fit score enum")
-                sort_ascending.append(sort_order_2 == "Ascending")
-            elif "Fit score" in filtered_df.columns:
-                sort_columns.append("Fit score")
-                sort_ascending.append(sort_order_2 == "Ascending")
-        elif sort_by_2 == "Company":
-            sort_columns.append("Company Name")
-            sort_ascending.append(sort_order_2 == "Ascending")
-        elif sort_by_2 == "Location":
-            sort_columns.append("Location")
-            sort_ascending.append(sort_order_2 == "Ascending")
-
-    if sort_by_3 != "None" and sort_by_3 != sort_by_1 and sort_by_3 != sort_by_2:
-        if sort_by_3 == "Location Priority" and "Location Priority" in filtered_df.columns:
-            sort_columns.append("Location Priority")
-            sort_ascending.append(sort_order_3 == "Ascending")
-        elif sort_by_3 == "Fit Score":
-            if "Fit score enum" in filtered_df.columns:
-                sort_columns.append("Fit score enum")
-                sort_ascending.append(sort_order_3 == "Ascending")
-            elif "Fit score" in filtered_df.columns:
-                sort_columns.append("Fit score")
-                sort_ascending.append(sort_order_3 == "Ascending")
-        elif sort_by_3 == "Company":
-            sort_columns.append("Company Name")
-            sort_ascending.append(sort_order_3 == "Ascending")
-        elif sort_by_3 == "Location":
-            sort_columns.append("Location")
-            sort_ascending.append(sort_order_3 == "Ascending")
+    available_columns = frozenset(df.columns)
+    for sort_by, sort_order in (
+        (sort_by_1, sort_order_1),
+        (sort_by_2, sort_order_2),
+        (sort_by_3, sort_order_3),
+    ):
+        column = next(
+            (c for c in SORT_COLUMN_CANDIDATES.get(sort_by, ()) if c in available_columns),
+            None,
+        )
+        if column is not None and column not in sort_columns:
+            sort_columns.append(column)
+            sort_ascending.append(sort_order == "Ascending")
 
     if sort_columns:
-        filtered_df = filtered_df.sort_values(sort_columns, ascending=sort_ascending)
-
-    visible_jobs_list = []
-    for row_idx, row in enumerate(filtered_df.itertuples(index=False)):
-        job_key = f"{_get(row, 'Job URL', '')}|{_get(row, 'Company Name', '')}|{row_idx}"
-        if job_key not in st.session_state.hidden_jobs:
-            visible_jobs_list.append((row_idx, row))
-
-    pagination_context = (
-        st.session_state.get("df_hash"),
-        tuple(selections["selected_fit_scores_raw"]),
-        tuple(selections["selected_applied_raw"]),
-        tuple(selections["selected_resume_raw"]),
-        tuple(selections["selected_cl_raw"]),
-        tuple(selections["selected_expired_raw"]),
-        tuple(selections.get("selected_bad_analysis_raw") or []),
-        tuple(selections.get("selected_sustainable_raw") or []),
-        selections["selected_jd_data"],
-        selections["selected_co_data"],
-        selections["show_priority_only"],
-        tuple(selections["selected_locations_raw"]),
-        tuple(selections["selected_company_raw"]),
-        sort_by_1,
-        sort_order_1,
-        sort_by_2,
-        sort_order_2,
-        sort_by_3,
-        sort_order_3,
-        len(st.session_state.hidden_jobs),
-    )
-    current_context_hash = hash(pagination_context)
-    if st.session_state.pagination_context_hash != current_context_hash:
-        st.session_state.pagination_context_hash = current_context_hash
+        sort_sig = (
+            st.session_state.df_version,
+            selections_key(selections),
+            tuple(sorted(hidden)),
+            tuple(sort_columns),
+            tuple(sort_ascending),
+        )
+        # Plain tuple compare first; reruns that only page, open cards or type keep the same order
+        if st.session_state.get("sort_sig") != sort_sig:
+            # Only the sort key columns of the visible rows are copied for sort_values
+            sort_keys = df[sort_columns].take(rows)
+            st.session_state.sort_positions = _sort_positions(*sort_sig, sort_keys)
+            st.session_state.sort_sig = sort_sig
+        rows = rows[st.session_state.sort_positions]
+
+    # Filter and sort widgets flag their own changes (mark_pagination_dirty); the guard covers
+    # what no widget reports: a reloaded frame or a job hidden by a checkbox
+    pagination_guard = (len(df), len(hidden))
+    if st.session_state.pop("pagination_dirty", False) or (
+        st.session_state.pagination_guard != pagination_guard
+    ):
+        st.session_state.pagination_guard = pagination_guard
         st.session_state.page_index = 0
         st.session_state.page_jump = 1
 
-    total_items = len(visible_jobs_list)
+    total_items = len(rows)
     total_pages = max(1, (total_items + PAGE_SIZE - 1) // PAGE_SIZE)
     st.session_state.page_index = max(
         0, min(int(st.session_state.page_index), total_pages - 1)
@@ -418,468 +815,32 @@ def render_jobs_view() -> None:
 
     start_idx = st.session_state.page_index * PAGE_SIZE
     end_idx = min(start_idx + PAGE_SIZE, total_items)
-    paginated_jobs_list = visible_jobs_list[start_idx:end_idx]
-
-    selected_applied = selections["selected_applied"]
-    selected_expired = selections["selected_expired"]
-    selected_bad_analysis = selections.get("selected_bad_analysis") or []
-    selected_sustainable = selections.get("selected_sustainable") or []
-
-    for _display_idx, (original_row_idx, row) in enumerate(paginated_jobs_list):
-        job_url_key = _get(row, "Job URL", "")
-        company_key = _get(row, "Company Name", "")
-        job_key = f"{job_url_key}|{company_key}|{original_row_idx}"
-
-        fit_score = _get(row, "Fit score", "") or "Unknown"
-        company = _get(row, "Company Name", "N/A")
-        job_title = _get(row, "Job Title", "N/A")
-        location = _get(row, "Location", "N/A")
-        location_priority = _get(row, "Location Priority", "")
-        resume_url = _get(row, "Tailored resume url", "")
-        job_url = _get(row, "Job URL", "")
-        company_overview = _get(row, "Company overview", "")
-        sustainable = _get(row, "Sustainable company", "")
-        job_analysis = _get(row, "Job analysis", "")
-        has_bad_analysis = _get(row, "Bad analysis", "") == "TRUE"
-        job_description = _get(row, "Job Description", "")
-        has_job_description = bool(job_description.strip() if job_description else False)
-        has_company_overview = bool(company_overview.strip() if company_overview else False)
-        missing_jd = not has_job_description
-        missing_co = not has_company_overview
-        applied = _get(row, "Applied", "")
-        expired = _get(row, "Job posting expired", "")
-        cover_letter = _get(row, "Tailored cover letter (to be humanized)", "")
-
-        if fit_score == "Very good fit":
-            color = "🟢"
-        elif fit_score == "Good fit":
-            color = "🟡"
-        elif fit_score in ["Poor fit", "Very poor fit"]:
-            color = "🔴"
-        else:
-            color = "⚪"
-
-        title_parts = [f"{color} {company} - {job_title}"]
-        if location:
-            title_parts.append(f"📍 {location}")
-        if fit_score and fit_score != "Unknown":
-            title_parts.append(f"⭐ {fit_score}")
-        # FALSE due only to missing CO is shown as Missing CO, not "Not Sustainable"
-        unsustainable_no_co = (
-            sustainable == "FALSE"
-            and (missing_co or "Insufficient company overview" in (job_analysis or ""))
+    # Only the current page, and only the columns a card reads, are converted to Python values
+    page_rows = rows[start_idx:end_idx]
+
+    # Titles and display strings depend only on the page's rows and the data version; full reruns
+    # that change neither (undo timer, idle auto-refresh, sidebar stats) reuse them as they are
+    page_sig = (st.session_state.df_version, page_rows.tobytes(), check_sustainability_enabled)
+    if st.session_state.get("page_sig") != page_sig:
+        page_df = df.take(page_rows)
+        card_meta = job_card_meta(page_df, check_sustainability_enabled)
+        st.session_state.page_cards = (
+            list(zip(job_ids(page_df).tolist(), card_meta.itertuples(index=False))),
+            card_columns(page_df),
+        )
+        st.session_state.page_sig = page_sig
+    page_cards, page_cols = st.session_state.page_cards
+    for i, (job_key, card) in enumerate(page_cards):
+        _render_job_card(
+            job_key,
+            card,
+            page_cols,
+            i,
+            selections,
+            check_sustainability_enabled,
+            has_location_priorities,
+            st.session_state.df_version,
         )
-        if check_sustainability_enabled and "Sustainable company" in df.columns:
-            if sustainable == "TRUE":
-                title_parts.append("🌱 Sustainable")
-            elif sustainable == "FALSE" and not unsustainable_no_co:
-                title_parts.append("⚠️ Not Sustainable")
-        if applied == "TRUE":
-            title_parts.append("✅ Applied")
-        if expired == "TRUE":
-            title_parts.append("❌ Expired")
-        if missing_jd:
-            if check_sustainability_enabled and sustainable == "TRUE":
-                title_parts.insert(0, "🔴⚠️")
-            else:
-                title_parts.append("⚠️ Missing JD")
-        if missing_co:
-            title_parts.append("⚠️ Missing CO")
-
-        # Show "Apply" at top only when fit is at least moderate; otherwise same fields live in Job details
-        show_apply_at_top = fit_score in ("Moderate fit", "Good fit", "Very good fit")
-        expanded = job_key == st.session_state.get("expanded_job_row")
-        with st.expander(" | ".join(title_parts), expanded=expanded):
-            if show_apply_at_top:
-                st.subheader("🔗 Apply")
-                if job_url:
-                    url_col1, url_col2 = st.columns([3, 1])
-                    with url_col1:
-                        st.write(f"**Job URL:** [{job_url}]({job_url})")
-                    with url_col2:
-                        current_expired = expired == "TRUE"
-                        st.checkbox(
-                            "Expired",
-                            value=current_expired,
-                            key=f"job_posting_expired_{job_key}",
-                            on_change=on_checkbox_change,
-                            args=(
-                                job_key,
-                                "Job posting expired",
-                                job_url_key,
-                                company_key,
-                                company,
-                                job_title,
-                                "TRUE" if current_expired else "FALSE",
-                                selected_expired,
-                            ),
-                        )
-                current_applied = applied == "TRUE"
-                st.checkbox(
-                    "✅ Applied",
-                    value=current_applied,
-                    key=f"applied_{job_key}",
-                    on_change=on_checkbox_change,
-                    args=(
-                        job_key,
-                        "Applied",
-                        job_url_key,
-                        company_key,
-                        company,
-                        job_title,
-                        "TRUE" if current_applied else "FALSE",
-                        selected_applied,
-                    ),
-                )
-                st.divider()
-
-            if resume_url:
-                st.subheader("📄 Tailored Resume")
-                resume_path = get_resume_path(resume_url)
-                if resume_path and resume_path.exists():
-                    st.write(f"**Path:** `{resume_path}`")
-                    file_size = resume_path.stat().st_size
-                    file_mtime = datetime.fromtimestamp(resume_path.stat().st_mtime)
-                    st.caption(
-                        f"File size: {file_size:,} bytes | Modified: {file_mtime.strftime('%Y-%m-%d %H:%M:%S')}"
-                    )
-                    pdf_cache_key = f"pdf_base64_{resume_path}"
-                    with st.expander("📄 Preview Resume PDF", expanded=False):
-                        if pdf_cache_key not in st.session_state:
-                            with st.spinner("Loading PDF preview..."):
-                                try:
-                                    with open(resume_path, "rb") as f:
-                                        pdf_bytes = f.read()
-                                        base64_pdf = base64.b64encode(pdf_bytes).decode("utf-8")
-                                        if len(st.session_state.pdf_cache_keys) >= MAX_PDF_CACHE_SIZE:
-                                            oldest_key = st.session_state.pdf_cache_keys.pop(0)
-                                            if oldest_key in st.session_state:
-                                                del st.session_state[oldest_key]
-                                        st.session_state[pdf_cache_key] = base64_pdf
-                                        st.session_state.pdf_cache_keys.append(pdf_cache_key)
-                                except Exception as e:
-                                    st.session_state[pdf_cache_key] = None
-                                    st.warning(f"Could not encode PDF: {e}")
-                        if st.session_state.get(pdf_cache_key):
-                            pdf_display = f'''
-                            <iframe src="data:application/pdf;base64,{st.session_state[pdf_cache_key]}"
-                                    width="700" height="900" type="application/pdf"
-                                    style="border: 1px solid #ccc;">
-                            </iframe>
-                            '''
-                            st.components.v1.html(pdf_display, height=920)
-                        else:
-                            try:
-                                with open(resume_path, "rb") as f:
-                                    st.download_button(
-                                        label="Download Resume PDF",
-                                        data=f.read(),
-                                        file_name=resume_path.name,
-                                        mime_type="application/pdf",
-                                    )
-                            except Exception as download_error:
-                                st.error(f"Could not read PDF file: {download_error}")
-                    if st.button(f"📂 Open in File Manager", key=f"open_{job_key}"):
-                        open_file_manager(resume_path)
-                        st.success(f"Opened file manager at: {resume_path.parent}")
-
-                    current_resume_feedback = _get(row, "Resume feedback", "")
-                    rf_key = f"resume_feedback_{job_key}"
-                    rf_loaded_key = f"{rf_key}__loaded"
-                    if rf_key not in st.session_state:
-                        st.session_state[rf_key] = current_resume_feedback
-                        st.session_state[rf_loaded_key] = current_resume_feedback
-                    else:
-                        last_loaded = st.session_state.get(rf_loaded_key, current_resume_feedback)
-                        if st.session_state.get(rf_key, "") == last_loaded and current_resume_feedback != last_loaded:
-                            st.session_state[rf_key] = current_resume_feedback
-                        st.session_state[rf_loaded_key] = current_resume_feedback
-                    st.text_area("Resume Feedback", key=rf_key, height=100)
-                    if st.button("💾 Save Resume Feedback", key=f"save_resume_feedback_{job_key}"):
-                        st.session_state.expanded_job_row = job_key
-                        st.session_state.last_refresh = time.time()
-                        handle_field_update(
-                            job_url_key,
-                            company_key,
-                            "Resume feedback",
-                            st.session_state.get(rf_key, ""),
-                            current_resume_feedback,
-                            "✅ Resume feedback saved",
-                        )
-                else:
-                    st.warning(f"Resume file not found at: {resume_url}")
-                    if resume_path:
-                        st.write(f"Expected location: {resume_path}")
-
-            if cover_letter:
-                st.divider()
-                st.subheader("📝 Cover Letter")
-                with st.expander("View/Edit Cover Letter"):
-                    current_cl_feedback = _get(row, "CL feedback", "")
-                    st.text_area(
-                        "Current Cover Letter",
-                        value=cover_letter,
-                        height=400,
-                        key=f"cl_view_{job_key}",
-                        disabled=True,
-                    )
-                    cf_key = f"cl_feedback_{job_key}"
-                    cf_loaded_key = f"{cf_key}__loaded"
-                    if cf_key not in st.session_state:
-                        st.session_state[cf_key] = current_cl_feedback
-                        st.session_state[cf_loaded_key] = current_cl_feedback
-                    else:
-                        last_loaded = st.session_state.get(cf_loaded_key, current_cl_feedback)
-                        if st.session_state.get(cf_key, "") == last_loaded and current_cl_feedback != last_loaded:
-                            st.session_state[cf_key] = current_cl_feedback
-                        st.session_state[cf_loaded_key] = current_cl_feedback
-                    st.text_area("Cover Letter Feedback", key=cf_key, height=100)
-                    if st.button("💾 Save CL Feedback", key=f"save_cl_feedback_{job_key}"):
-                        st.session_state.expanded_job_row = job_key
-                        st.session_state.last_refresh = time.time()
-                        handle_field_update(
-                            job_url_key,
-                            company_key,
-                            "CL feedback",
-                            st.session_state.get(cf_key, ""),
-                            current_cl_feedback,
-                            "✅ Cover letter feedback saved",
-                        )
-
-            st.divider()
-            st.subheader("📌 Job details")
-            if not show_apply_at_top:
-                if job_url:
-                    url_col1, url_col2 = st.columns([3, 1])
-                    with url_col1:
-                        st.write(f"**Job URL:** [{job_url}]({job_url})")
-                    with url_col2:
-                        _current_expired = expired == "TRUE"
-                        st.checkbox(
-                            "Expired",
-                            value=_current_expired,
-                            key=f"job_posting_expired_{job_key}",
-                            on_change=on_checkbox_change,
-                            args=(
-                                job_key,
-                                "Job posting expired",
-                                job_url_key,
-                                company_key,
-                                company,
-                                job_title,
-                                "TRUE" if _current_expired else "FALSE",
-                                selected_expired,
-                            ),
-                        )
-                _current_applied = applied == "TRUE"
-                st.checkbox(
-                    "✅ Applied",
-                    value=_current_applied,
-                    key=f"applied_{job_key}",
-                    on_change=on_checkbox_change,
-                    args=(
-                        job_key,
-                        "Applied",
-                        job_url_key,
-                        company_key,
-                        company,
-                        job_title,
-                        "TRUE" if _current_applied else "FALSE",
-                        selected_applied,
-                    ),
-                )
-            st.write(f"**Company:** {company}")
-            st.write(f"**Job Title:** {job_title}")
-            st.write(f"**Location:** {location}")
-            if has_location_priorities and location_priority:
-                st.write(f"**Location Priority:** {location_priority}")
-            if fit_score != "Unknown":
-                st.write(f"**Fit Score:** {fit_score}")
-            if check_sustainability_enabled and "Sustainable company" in df.columns:
-                if sustainable == "TRUE":
-                    sustainable_icon = "✅"
-                    sustainable_label = sustainable
-                elif unsustainable_no_co:
-                    sustainable_icon = "⚠️"
-                    sustainable_label = "Missing overview (not evaluated)"
-                elif (sustainable or "").strip() not in ("TRUE", "FALSE"):
-                    sustainable_icon = "⚠️"
-                    sustainable_label = "Missing overview (not evaluated)" if missing_co else "Unknown"
-                else:
-                    sustainable_icon = "❌"
-                    sustainable_label = sustainable
-                st.write(f"**Sustainable Company:** {sustainable_icon} {sustainable_label}")
-                current_sustainable = sustainable == "TRUE"
-                st.checkbox(
-                    "🌱 Mark as sustainable company",
-                    value=current_sustainable,
-                    key=f"sustainable_company_{job_key}",
-                    on_change=on_checkbox_change,
-                    args=(
-                        job_key,
-                        "Sustainable company",
-                        job_url_key,
-                        company_key,
-                        company,
-                        job_title,
-                        "TRUE" if current_sustainable else "FALSE",
-                        selected_sustainable,
-                    ),
-                )
-            if check_sustainability_enabled and "Sustainability keyword matches" in df.columns:
-                sust_kw = _get(row, "Sustainability keyword matches", "").strip()
-                if sust_kw:
-                    st.write(f"**Sustainability keyword matches:** {sust_kw}")
-            st.divider()
-            if job_analysis:
-                analysis_col1, analysis_col2 = st.columns([3, 1])
-                with analysis_col1:
-                    with st.expander("Job Analysis"):
-                        st.markdown(job_analysis)
-                with analysis_col2:
-                    st.checkbox(
-                        "Bad Analysis",
-                        value=has_bad_analysis,
-                        key=f"bad_analysis_{job_key}",
-                        on_change=on_checkbox_change,
-                        args=(
-                            job_key,
-                            "Bad analysis",
-                            job_url_key,
-                            company_key,
-                            company,
-                            job_title,
-                            "TRUE" if has_bad_analysis else "FALSE",
-                            selected_bad_analysis,
-                        ),
-                    )
-
-            st.divider()
-            st.subheader("📋 Job Description")
-            if has_job_description:
-                with st.expander("View/Edit Job Description"):
-                    current_jd = job_description or ""
-                    jd_key = f"job_description_{job_key}"
-                    jd_loaded_key = f"{jd_key}__loaded"
-                    if jd_key not in st.session_state:
-                        st.session_state[jd_key] = current_jd
-                        st.session_state[jd_loaded_key] = current_jd
-                    else:
-                        last_loaded = st.session_state.get(jd_loaded_key, current_jd)
-                        if st.session_state.get(jd_key, "") == last_loaded and current_jd != last_loaded:
-                            st.session_state[jd_key] = current_jd
-                        st.session_state[jd_loaded_key] = current_jd
-                    st.text_area("Job Description", key=jd_key, height=300)
-                    if st.button("💾 Save Job Description", key=f"save_job_description_{job_key}"):
-                        st.session_state.expanded_job_row = job_key
-                        st.session_state.last_refresh = time.time()
-                        handle_field_update(
-                            job_url_key,
-                            company_key,
-                            "Job Description",
-                            st.session_state.get(jd_key, ""),
-                            current_jd,
-                            "✅ Job description saved!",
-                        )
-            else:
-                if check_sustainability_enabled and sustainable == "TRUE":
-                    st.error(
-                        "🚨 **CRITICAL: Missing Job Description** - This sustainable company job cannot be analyzed without a job description!"
-                    )
-                else:
-                    st.warning(
-                        "⚠️ **Missing Job Description** - This job cannot be analyzed without a job description."
-                    )
-                st.subheader("✏️ Add Job Description")
-                current_jd = job_description or ""
-                jd_key = f"job_description_{job_key}"
-                jd_loaded_key = f"{jd_key}__loaded"
-                if jd_key not in st.session_state:
-                    st.session_state[jd_key] = current_jd
-                    st.session_state[jd_loaded_key] = current_jd
-                else:
-                    last_loaded = st.session_state.get(jd_loaded_key, current_jd)
-                    if st.session_state.get(jd_key, "") == last_loaded and current_jd != last_loaded:
-                        st.session_state[jd_key] = current_jd
-                    st.session_state[jd_loaded_key] = current_jd
-                st.text_area(
-                    "Job Description",
-                    key=jd_key,
-                    height=300,
-                    help="Paste the job description from the LinkedIn job posting here",
-                )
-                if st.button("💾 Save Job Description", key=f"save_job_description_missing_{job_key}"):
-                    st.session_state.expanded_job_row = job_key
-                    st.session_state.last_refresh = time.time()
-                    handle_field_update(
-                        job_url_key,
-                        company_key,
-                        "Job Description",
-                        st.session_state.get(jd_key, ""),
-                        current_jd,
-                        "✅ Job description saved! The job will be analyzed in the next cycle.",
-                    )
-
-            st.divider()
-            st.subheader("🏢 Company Overview")
-            if company_overview:
-                with st.expander("View/Edit Company Overview"):
-                    current_co = company_overview
-                    co_key = f"company_overview_{job_key}"
-                    co_loaded_key = f"{co_key}__loaded"
-                    if co_key not in st.session_state:
-                        st.session_state[co_key] = current_co
-                        st.session_state[co_loaded_key] = current_co
-                    else:
-                        last_loaded = st.session_state.get(co_loaded_key, current_co)
-                        if st.session_state.get(co_key, "") == last_loaded and current_co != last_loaded:
-                            st.session_state[co_key] = current_co
-                        st.session_state[co_loaded_key] = current_co
-                    st.text_area("Company Overview", key=co_key, height=200)
-                    if st.button("💾 Save Company Overview", key=f"save_company_overview_{job_key}"):
-                        st.session_state.expanded_job_row = job_key
-                        st.session_state.last_refresh = time.time()
-                        handle_field_update(
-                            job_url_key,
-                            company_key,
-                            "Company overview",
-                            st.session_state.get(co_key, ""),
-                            current_co,
-                            "✅ Company overview saved!",
-                        )
-            else:
-                st.warning(
-                    "⚠️ **Missing Company Overview** - Company overview is needed for sustainability checks and better analysis."
-                )
-                st.subheader("✏️ Add Company Overview")
-                current_co = company_overview
-                co_key = f"company_overview_{job_key}"
-                co_loaded_key = f"{co_key}__loaded"
-                if co_key not in st.session_state:
-                    st.session_state[co_key] = current_co
-                    st.session_state[co_loaded_key] = current_co
-                else:
-                    last_loaded = st.session_state.get(co_loaded_key, current_co)
-                    if st.session_state.get(co_key, "") == last_loaded and current_co != last_loaded:
-                        st.session_state[co_key] = current_co
-                    st.session_state[co_loaded_key] = current_co
-                st.text_area(
-                    "Company Overview",
-                    key=co_key,
-                    height=200,
-                    help="Paste the company overview/description here",
-                )
-                if st.button("💾 Save Company Overview", key=f"save_company_overview_missing_{job_key}"):
-                    st.session_state.expanded_job_row = job_key
-                    st.session_state.last_refresh = time.time()
-                    handle_field_update(
-                        job_url_key,
-                        company_key,
-                        "Company overview",
-                        st.session_state.get(co_key, ""),
-                        current_co,
-                        "✅ Company overview saved!",
-                    )
 
     # Sticky pagination
     if total_items > 0:
@@ -948,20 +909,12 @@ def render_jobs_view() -> None:
             st.rerun()
 
     if st.session_state.undo_stack:
-        job_key, field_name, old_value, job_url_key, company_key, company, job_title = (
-            st.session_state.undo_stack[-1]
-        )
-        field_display = {
-            "Applied": "Applied",
-            "Job posting expired": "Expired",
-            "Bad analysis": "Bad Analysis",
-            "Sustainable company": "Sustainable",
-        }.get(field_name, field_name)
-        remaining_time = UNDO_POPUP_TIMEOUT
-        if st.session_state.undo_stack_timestamp is not None:
-            elapsed = time.time() - st.session_state.undo_stack_timestamp
-            remaining_time = max(0, UNDO_POPUP_TIMEOUT - elapsed)
-
+        job_key, field_name, old_value = st.session_state.undo_stack[-1]
+        company, job_title = "N/A", "N/A"
+        if job_key in df.index:
+            company = str(df.at[job_key, "Company Name"]) or "N/A"
+            job_title = df.at[job_key, "Job Title"] or "N/A"
+        field_display = _FIELD_DISPLAY.get(field_name, field_name)
         with st.container():
             st.markdown('<div class="undo-marker-unique"></div>', unsafe_allow_html=True)
             st.markdown(f'<div class="undo-text">ℹ️ Job hidden</div>', unsafe_allow_html=True)
@@ -986,53 +939,8 @@ def render_jobs_view() -> None:
                     help="",
                     use_container_width=False,
                 )
-                st.markdown(
-                    f"""
-                    <style>
-                    div[data-testid="stVerticalBlock"]:has(button[data-testid*="{auto_hide_button_key}"]) {{
-                        display: none !important;
-                    }}
-                    button[data-testid*="{auto_hide_button_key}"] {{
-                        display: none !important;
-                        visibility: hidden !important;
-                        position: absolute !important;
-                        left: -9999px !important;
-                        width: 0 !important;
-                        height: 0 !important;
-                        padding: 0 !important;
-                        margin: 0 !important;
-                    }}
-                    </style>
-                    """,
-                    unsafe_allow_html=True,
-                )
-                st.components.v1.html(
-                    f"""
-                <script>
-                (function() {{
-                    const timeoutMs = {int(remaining_time * 1000)};
-                    const buttonKey = '{auto_hide_button_key}';
-                    setTimeout(function() {{
-                        let triggered = false;
-                        const allButtons = document.querySelectorAll('button');
-                        for (let btn of allButtons) {{
-                            const testId = btn.getAttribute('data-testid') || '';
-                            if (testId.includes(buttonKey)) {{
-                                btn.click();
-                                triggered = true;
-                                break;
-                            }}
-                        }}
-                        if (!triggered && window.parent) {{
-                            try {{
-                                window.parent.postMessage({{ type: 'streamlit:rerun' }}, '*');
-                                triggered = true;
-                            }} catch(e) {{}}
-                        }}
-                        if (!triggered) {{ window.location.reload(); }}
-                    }}, timeoutMs);
-                }})();
-                </script>
-                """,
-                    height=0,
-                )
+                # CSS hiding this button is static (styles.CUSTOM_CSS); the timer script is keyed
+                # on the undo's timestamp only, so it is byte-identical until the next undo
+                started = st.session_state.undo_stack_timestamp or time.time()
+                deadline_ms = int((started + UNDO_POPUP_TIMEOUT) * 1000)
+                st.components.v1.html(undo_timer_js(auto_hide_button_key, deadline_ms), height=0)
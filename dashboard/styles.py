@@ -1,6 +1,15 @@
 """Dashboard CSS and inline JS for layout (undo popup, sticky pager)."""
+import re
 
-CUSTOM_CSS = """
+
+def _minify_css(css: str) -> str:
+    """Drop comments and collapse whitespace; CSS is re-sent to the browser on every rerun."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};])\s*", r"\1", css).strip()
+
+
+CUSTOM_CSS = _minify_css("""
 <style>
     :root {
         /* JS will keep these in sync with stMain */
@@ -50,6 +59,11 @@ CUSTOM_CSS = """
         margin-bottom: 8px !important;
     }
 
+    /* Hidden button the undo timer clicks; its container carries the st-key-<key> class */
+    div[class*="st-key-undo_auto_hide_"] {
+        display: none !important;
+    }
+
     /* Target the button within the fixed popup specifically */
     div[data-testid="stVerticalBlock"]:has(.undo-marker-unique) button {
         width: 100% !important;
@@ -126,7 +140,7 @@ CUSTOM_CSS = """
         color: #e6edf3 !important;
     }
 </style>
-"""
+""")
 
 PAGER_JS = """
 <script>
@@ -174,3 +188,23 @@ PAGER_JS = """
 })();
 </script>
 """
+
+
+def undo_timer_js(button_key: str, deadline_ms: int) -> str:
+    """Script that clicks the hidden undo auto-hide button at deadline_ms (epoch ms).
+    Depends only on the undo's timestamp, so reruns re-send identical HTML and the iframe is kept.
+    """
+    return f"""
+<script>
+(function() {{
+  const doc = window.parent && window.parent.document ? window.parent.document : document;
+  const host = window.parent || window;
+  // One pending timer per page: a newer undo replaces the older one
+  if (host.__jabUndoTimer) clearTimeout(host.__jabUndoTimer);
+  host.__jabUndoTimer = setTimeout(function() {{
+    const btn = doc.querySelector('.st-key-{button_key} button');
+    if (btn) btn.click();
+  }}, Math.max(0, {deadline_ms} - Date.now()));
+}})();
+</script>
+"""
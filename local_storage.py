@@ -1,3 +1,4 @@
+import itertools
 import re
 import sqlite3
 from pathlib import Path
@@ -12,22 +13,27 @@ class JobDatabase:
     SQLite connections are created with check_same_thread=False for compatibility.
     """
     
-    def __init__(self, db_path: str, columns: list[str]):
+    def __init__(self, db_path: str, columns: list[str], pragmas: tuple[str, ...] = ()):
         """
         Initialize the job database.
         
         Args:
             db_path: Path to the SQLite database file
             columns: List of column names for the jobs table
+            pragmas: PRAGMA statements (without the PRAGMA keyword) run on every
+                new connection, e.g. ("synchronous=NORMAL",)
         """
         self.db_path = Path(db_path)
         self.columns = columns
+        self.pragmas = tuple(pragmas)
         self._ensure_database_exists()
     
     def _get_connection(self):
         """Get a database connection."""
         conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        for pragma in self.pragmas:
+            conn.execute(f"PRAGMA {pragma}")
         return conn
     
     def _ensure_database_exists(self):
@@ -103,6 +109,45 @@ class JobDatabase:
         finally:
             conn.close()
     
+    def get_all_tuples(self, read_only: bool = False) -> tuple[list[str], list[tuple]]:
+        """
+        Get all jobs as plain tuples, the cheapest shape sqlite3 can return.
+        
+        Returns:
+            (['id', *self.columns], rows) with rows ordered by id; NULLs stay None
+        
+        Args:
+            read_only: Open the file with mode=ro (no pragmas), for readers such
+                as the dashboard that must never take a write lock
+        """
+        if read_only:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        else:
+            conn = self._get_connection()
+        conn.row_factory = None  # Tuples straight from C, no sqlite3.Row per row
+        try:
+            columns = ', '.join([f'"{col}"' for col in self.columns])
+            rows = conn.execute(f'SELECT id, {columns} FROM jobs ORDER BY id').fetchall()
+        finally:
+            conn.close()
+        return ['id', *self.columns], rows
+    
+    def get_all_as_dataframe(self, read_only: bool = False):
+        """
+        Get all jobs as a pandas DataFrame, built column-wise from get_all_tuples.
+        
+        Columns are self.columns in order with NULL as '', and the index is the
+        row id (unnamed), so a job keeps its label across reads.
+        
+        Args:
+            read_only: See get_all_tuples
+        """
+        import pandas as pd  # Only whole-table readers need pandas
+        
+        columns, rows = self.get_all_tuples(read_only=read_only)
+        df = pd.DataFrame.from_records(rows, columns=columns, index='id')
+        return df.rename_axis(None).fillna('')
+    
     def count(self) -> int:
         """Get the total number of jobs."""
         conn = self._get_connection()
@@ -241,26 +286,35 @@ class JobDatabase:
         """
         Update multiple jobs efficiently using job URL and company name.
         
+        Consecutive updates that set the same columns share one executemany()
+        call, and everything is written in a single transaction.
+        
         Args:
             updates: List of (job_url, company_name, updates_dict) tuples
         """
         if not updates:
             return
         
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        # Only consecutive runs are batched, so updates still apply in the order given
+        runs = itertools.groupby(
+            (u for u in updates if u[2]), key=lambda u: tuple(u[2].keys())
+        )
         
-        for job_url, company_name, update_dict in updates:
-            if update_dict:
-                set_clause = ", ".join([f'"{k}" = ?' for k in update_dict.keys()])
-                values = [str(v) if v is not None else '' for v in update_dict.values()]
-                cursor.execute(
-                    f'UPDATE jobs SET {set_clause} WHERE "Job URL" = ? AND "Company Name" = ?',
-                    values + [job_url, company_name]
-                )
-        
-        conn.commit()
-        conn.close()
+        conn = self._get_connection()
+        try:
+            with conn:
+                for fields, run in runs:
+                    set_clause = ", ".join([f'"{k}" = ?' for k in fields])
+                    conn.executemany(
+                        f'UPDATE jobs SET {set_clause} WHERE "Job URL" = ? AND "Company Name" = ?',
+                        [
+                            [str(v) if v is not None else '' for v in update_dict.values()]
+                            + [job_url, company_name]
+                            for job_url, company_name, update_dict in run
+                        ]
+                    )
+        finally:
+            conn.close()
     
     def sort_by(self, sort_specs: list[tuple]):
         """
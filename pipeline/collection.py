@@ -10,7 +10,7 @@ from utils import (
 )
 from config import _get_job_filters, _save_job_filters, CONFIG_FILE
 from api_methods import get_search_parameters
-from core import ApifyDataSource, LinkedInDataSource
+from core import get_source
 
 from .constants import CHECK_SUSTAINABILITY, email_address, linkedin_password
 from .filtering import (
@@ -68,7 +68,7 @@ def collect_and_filter_jobs(driver, sheet, search_urls: list = None):
     filters = _get_job_filters()
     new_rows = []
     jobs_to_scrape = []
-    source = LinkedInDataSource()
+    source = get_source("linkedin")
 
     for search_url in search_urls:
         print(f"Collecting jobs from search URL: {search_url}")
@@ -102,7 +102,7 @@ def collect_and_filter_jobs(driver, sheet, search_urls: list = None):
 
 def collect_jobs_via_apify(sheet, search_url=None, params=None):
     """Collect jobs using ApifyDataSource. Returns list of (job_url, company_name) for new jobs."""
-    source = ApifyDataSource()
+    source = get_source("apify")
     if not source.is_available():
         print("Apify is currently unavailable (usage limit reached). Skipping collection phase.")
         return []
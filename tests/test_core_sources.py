@@ -82,3 +82,60 @@ class TestFactory:
                 return []
         repo = create_repository(S())
         assert repo.get_all_records() == []
+
+    def test_create_data_source_returns_shared_instance(self):
+        assert create_data_source("apify") is create_data_source("APIFY")
+
+
+class TestSourceRegistry:
+    def test_get_source_returns_singletons(self):
+        from core.sources import SOURCES, get_source
+        assert get_source("apify") is SOURCES["apify"]
+        assert get_source("linkedin") is get_source(" LinkedIn ")
+
+    def test_get_source_unknown_raises(self):
+        from core.sources import get_source
+        with pytest.raises(ValueError, match="Unknown data source"):
+            get_source("indeed")
+
+    def test_sources_are_slotted_and_frozen(self):
+        src = ApifyDataSource()
+        assert not hasattr(src, "__dict__")
+        with pytest.raises(Exception):
+            src.extra = 1
+
+
+class TestApifyFetchJobs:
+    def _items(self, n):
+        return [
+            {"job_title": f"Dev {i}", "company": "Acme", "job_url": f"https://u/{i}"}
+            for i in range(n)
+        ]
+
+    def test_max_items_stops_early(self, monkeypatch):
+        import core.sources.apify_source as mod
+        monkeypatch.setattr(mod, "fetch_jobs_via_apify", lambda **kw: self._items(10))
+        monkeypatch.setattr(mod.utils, "APIFY_AVAILABLE", True)
+        out = list(ApifyDataSource().fetch_jobs(params={"keywords": "x"}, max_items=3))
+        assert [j["job_title"] for j in out] == ["Dev 0", "Dev 1", "Dev 2"]
+
+    def test_max_items_closes_streaming_upstream(self, monkeypatch):
+        import core.sources.apify_source as mod
+        consumed = []
+
+        def stream(**kw):
+            for item in self._items(10):
+                consumed.append(item)
+                yield item
+
+        monkeypatch.setattr(mod, "fetch_jobs_via_apify", stream)
+        monkeypatch.setattr(mod.utils, "APIFY_AVAILABLE", True)
+        out = list(ApifyDataSource().fetch_jobs(params={"keywords": "x"}, max_items=2))
+        assert len(out) == 2
+        assert len(consumed) == 2
+
+    def test_no_max_items_yields_all(self, monkeypatch):
+        import core.sources.apify_source as mod
+        monkeypatch.setattr(mod, "fetch_jobs_via_apify", lambda **kw: self._items(5))
+        monkeypatch.setattr(mod.utils, "APIFY_AVAILABLE", True)
+        assert len(list(ApifyDataSource().fetch_jobs(params={"keywords": "x"}))) == 5
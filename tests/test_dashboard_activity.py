@@ -0,0 +1,50 @@
+"""Unit tests for the Activity view's log tail reader."""
+
+import pytest
+
+from dashboard.activity import _tail_lines
+
+
+def _expected(text, max_lines):
+    return text.splitlines(keepends=True)[-max_lines:]
+
+
+LOG_TEXT = "".join(
+    f"line {i} {'é' * (i % 5)}{'x' * (i * 7 % 23)}\n" for i in range(40)
+)
+
+
+class TestTailLines:
+    def test_file_smaller_than_one_chunk_keeps_first_line(self, tmp_path):
+        log = tmp_path / "activity.log"
+        log.write_text("first\nsecond\nthird\n", encoding="utf-8")
+        assert _tail_lines(log, 10) == ["first\n", "second\n", "third\n"]
+        assert _tail_lines(log, 3) == ["first\n", "second\n", "third\n"]
+        assert _tail_lines(log, 2) == ["second\n", "third\n"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 8, 17, 64])
+    def test_lines_crossing_chunk_boundaries(self, tmp_path, chunk_size):
+        log = tmp_path / "activity.log"
+        log.write_text(LOG_TEXT, encoding="utf-8")
+        for max_lines in (1, 2, 5, 39, 40, 41):
+            assert _tail_lines(log, max_lines, chunk_size) == _expected(LOG_TEXT, max_lines)
+
+    @pytest.mark.parametrize("chunk_size", [2, 5, 64 * 1024])
+    def test_no_trailing_newline(self, tmp_path, chunk_size):
+        log = tmp_path / "activity.log"
+        text = LOG_TEXT + "last line without newline"
+        log.write_text(text, encoding="utf-8")
+        for max_lines in (1, 2, 3, 41, 50):
+            assert _tail_lines(log, max_lines, chunk_size) == _expected(text, max_lines)
+
+    def test_line_crossing_default_chunk(self, tmp_path):
+        log = tmp_path / "activity.log"
+        text = "head\n" + "a" * (64 * 1024) + "\ntail\n"
+        log.write_text(text, encoding="utf-8")
+        assert _tail_lines(log, 2) == _expected(text, 2)
+        assert _tail_lines(log, 3) == _expected(text, 3)
+
+    def test_empty_file(self, tmp_path):
+        log = tmp_path / "activity.log"
+        log.write_bytes(b"")
+        assert _tail_lines(log, 5) == []
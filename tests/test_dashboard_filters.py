@@ -0,0 +1,193 @@
+"""Dashboard filter masks checked against the original string-based implementation."""
+
+import itertools
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.data import _typed_jobs_frame
+from dashboard.filters import build_filter_mask, derived_masks, filters_active
+from utils import SHEET_HEADER
+
+STATUS_VALUES = ["TRUE", "FALSE", ""]
+
+NO_FILTERS = {
+    "selected_fit_scores": [],
+    "selected_applied": [],
+    "selected_bad_analysis": [],
+    "selected_expired": [],
+    "selected_sustainable": [],
+    "selected_resume": [],
+    "selected_cl": [],
+    "selected_locations": [],
+    "selected_company": [],
+    "selected_jd_data": "Unset",
+    "selected_co_data": "Unset",
+    "show_priority_only": False,
+}
+
+# Selection key -> options offered by its sidebar widget
+MULTISELECT_OPTIONS = {
+    "selected_fit_scores": ["Unknown", "Good fit", "Poor fit", "Very good fit"],
+    "selected_applied": ["Applied", "Not Applied", "Unknown"],
+    "selected_bad_analysis": ["Yes", "No", "Unknown"],
+    "selected_expired": ["Active", "Expired", "Unknown"],
+    "selected_sustainable": ["Yes", "No", "Unknown"],
+    "selected_resume": ["Yes", "No", "Unknown"],
+    "selected_cl": ["Yes", "No", "Unknown"],
+    "selected_locations": ["Unknown", "Berlin", "Remote"],
+    "selected_company": ["Unknown", "A", "B"],
+}
+
+
+def _raw_frame(n=120, seed=7):
+    """All-text frame shaped like JobDatabase.get_all_as_dataframe (blank = '')."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        row = {col: "" for col in SHEET_HEADER}
+        row.update({
+            "Fit score": rng.choice(["Good fit", "Poor fit", "Very good fit", ""]),
+            "Location": rng.choice(["Berlin", "Remote", ""]),
+            "Company Name": rng.choice(["A", "B", "C", ""]),
+            "Applied": rng.choice(STATUS_VALUES),
+            "Bad analysis": rng.choice(STATUS_VALUES),
+            "Job posting expired": rng.choice(STATUS_VALUES),
+            "Sustainable company": rng.choice(STATUS_VALUES),
+            "Tailored resume url": rng.choice(["r.pdf", ""]),
+            "Tailored cover letter (to be humanized)": rng.choice(["CL", ""]),
+            "Job Description": rng.choice(["JD", ""]),
+            "Company overview": rng.choice(["CO", ""]),
+            "Location Priority": rng.choice(["", "1", "10", "2"]),
+            "Fit score enum": rng.choice(["", "0", "3"]),
+        })
+        rows.append(row)
+    return pd.DataFrame(rows, columns=SHEET_HEADER, index=pd.RangeIndex(1, n + 1))
+
+
+def _blank(col):
+    return col.isna() | (col == "")
+
+
+def _in_or_unknown(col, selected):
+    mask = col.isin([v for v in selected if v != "Unknown"])
+    if "Unknown" in selected:
+        mask = mask | _blank(col)
+    return mask
+
+
+def _status(col, selected, yes, no, no_is_not_true=True):
+    mask = pd.Series(False, index=col.index)
+    if yes in selected:
+        mask = mask | (col == "TRUE")
+    if no in selected:
+        mask = mask | ((col != "TRUE") if no_is_not_true else (col == "FALSE"))
+    if "Unknown" in selected:
+        mask = mask | _blank(col)
+    return mask
+
+
+def _presence(col, selected):
+    mask = pd.Series(False, index=col.index)
+    if "Yes" in selected:
+        mask = mask | ~_blank(col)
+    if "No" in selected or "Unknown" in selected:
+        mask = mask | _blank(col)
+    return mask
+
+
+def reference_mask(df, s):
+    """The pre-numpy apply_filter_mask, on the all-text frame, returning its row mask."""
+    mask = pd.Series(True, index=df.index)
+    if s["selected_fit_scores"]:
+        mask &= _in_or_unknown(df["Fit score"], s["selected_fit_scores"])
+    if s["selected_applied"]:
+        mask &= _status(df["Applied"], s["selected_applied"], "Applied", "Not Applied")
+    if s["selected_bad_analysis"]:
+        mask &= _status(df["Bad analysis"], s["selected_bad_analysis"], "Yes", "No")
+    if s["selected_expired"]:
+        mask &= _status(df["Job posting expired"], s["selected_expired"], "Expired", "Active")
+    if s["selected_sustainable"]:
+        mask &= _status(df["Sustainable company"], s["selected_sustainable"], "Yes", "No", no_is_not_true=False)
+    if s["selected_resume"]:
+        mask &= _presence(df["Tailored resume url"], s["selected_resume"])
+    if s["selected_cl"]:
+        mask &= _presence(df["Tailored cover letter (to be humanized)"], s["selected_cl"])
+    if s["selected_locations"]:
+        mask &= _in_or_unknown(df["Location"], s["selected_locations"])
+    if s["selected_company"]:
+        mask &= _in_or_unknown(df["Company Name"], s["selected_company"])
+    has_jd = ~_blank(df["Job Description"])
+    has_co = ~_blank(df["Company overview"])
+    if s["selected_jd_data"] == "Has":
+        mask &= has_jd
+    elif s["selected_jd_data"] == "Missing":
+        mask &= ~has_jd
+    if s["selected_co_data"] == "Has":
+        mask &= has_co
+    elif s["selected_co_data"] == "Missing":
+        mask &= ~has_co
+    if s["show_priority_only"]:
+        mask &= (df["Sustainable company"] == "TRUE") & ~has_jd
+    return mask.to_numpy(dtype=bool)
+
+
+def _single_filter_cases():
+    for key, options in MULTISELECT_OPTIONS.items():
+        for r in range(1, len(options) + 1):
+            for combo in itertools.combinations(options, r):
+                yield {**NO_FILTERS, key: list(combo)}
+    for key in ("selected_jd_data", "selected_co_data"):
+        for value in ("Has", "Missing"):
+            yield {**NO_FILTERS, key: value}
+    yield {**NO_FILTERS, "show_priority_only": True}
+
+
+COMBINED_CASES = [
+    {
+        **NO_FILTERS,
+        "selected_fit_scores": ["Good fit", "Very good fit", "Unknown"],
+        "selected_applied": ["Not Applied", "Unknown"],
+        "selected_expired": ["Active", "Unknown"],
+        "selected_bad_analysis": ["No", "Unknown"],
+        "selected_sustainable": ["Yes", "Unknown"],
+    },
+    {
+        **NO_FILTERS,
+        "selected_locations": ["Berlin", "Unknown"],
+        "selected_company": ["A"],
+        "selected_resume": ["Yes"],
+        "selected_co_data": "Missing",
+    },
+    # Status filters leave nothing: the early exit must still return an all-False mask
+    {**NO_FILTERS, "selected_applied": ["Applied"], "selected_sustainable": ["No"],
+     "selected_fit_scores": ["Missing fit"], "selected_jd_data": "Has"},
+]
+
+
+@pytest.fixture(scope="module")
+def frames():
+    raw = _raw_frame()
+    typed = _typed_jobs_frame(raw.copy())
+    return raw, typed, derived_masks(typed)
+
+
+class TestBuildFilterMask:
+    @pytest.mark.parametrize("selections", [*_single_filter_cases(), *COMBINED_CASES])
+    def test_matches_reference(self, frames, selections):
+        raw, typed, masks = frames
+        expected = reference_mask(raw, selections)
+        np.testing.assert_array_equal(build_filter_mask(typed, selections), expected)
+        np.testing.assert_array_equal(build_filter_mask(typed, selections, masks), expected)
+
+    def test_no_filters_is_show_all(self, frames):
+        raw, typed, _ = frames
+        assert not filters_active(NO_FILTERS)
+        assert reference_mask(raw, NO_FILTERS).all()
+        assert build_filter_mask(typed, NO_FILTERS).all()
+
+    def test_derived_masks_are_read_only(self, frames):
+        _, _, masks = frames
+        assert all(not mask.flags.writeable for mask in masks.values())
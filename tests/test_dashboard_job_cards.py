@@ -0,0 +1,153 @@
+"""Column-wise job card metadata checked against the original per-row card code."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.data import _typed_jobs_frame
+from dashboard.job_cards import CARD_COLUMNS, _display_strings, card_columns, job_card_meta
+from utils import SHEET_HEADER
+
+
+def row_values(row, columns):
+    """The original per-card conversion of an itertuples row to display strings."""
+    values = {}
+    for col, value in zip(columns, row):
+        if value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value)):
+            values[col] = ""
+        elif isinstance(value, (bool, np.bool_)):
+            values[col] = "TRUE" if value else "FALSE"
+        else:
+            values[col] = str(value)
+    return values
+
+
+def reference_meta(r, show_sustainability):
+    """The original per-card title and flags, from one row_values dict."""
+    fit_score = r["Fit score"] or "Unknown"
+    sustainable = r["Sustainable company"]
+    missing_jd = not r["Job Description"].strip()
+    missing_co = not r["Company overview"].strip()
+    if fit_score == "Very good fit":
+        color = "🟢"
+    elif fit_score == "Good fit":
+        color = "🟡"
+    elif fit_score in ["Poor fit", "Very poor fit"]:
+        color = "🔴"
+    else:
+        color = "⚪"
+    title_parts = [f"{color} {r['Company Name']} - {r['Job Title']}"]
+    if r["Location"]:
+        title_parts.append(f"📍 {r['Location']}")
+    if fit_score and fit_score != "Unknown":
+        title_parts.append(f"⭐ {fit_score}")
+    unsustainable_no_co = sustainable == "FALSE" and (
+        missing_co or "Insufficient company overview" in (r["Job analysis"] or "")
+    )
+    if show_sustainability:
+        if sustainable == "TRUE":
+            title_parts.append("🌱 Sustainable")
+        elif sustainable == "FALSE" and not unsustainable_no_co:
+            title_parts.append("⚠️ Not Sustainable")
+    if r["Applied"] == "TRUE":
+        title_parts.append("✅ Applied")
+    if r["Job posting expired"] == "TRUE":
+        title_parts.append("❌ Expired")
+    if missing_jd:
+        if show_sustainability and sustainable == "TRUE":
+            title_parts.insert(0, "🔴⚠️")
+        else:
+            title_parts.append("⚠️ Missing JD")
+    if missing_co:
+        title_parts.append("⚠️ Missing CO")
+    return " | ".join(title_parts), missing_jd, missing_co, unsustainable_no_co
+
+
+ROWS = [
+    {"Company Name": "Acme", "Job Title": "Dev", "Location": "Berlin", "Fit score": "Very good fit",
+     "Fit score enum": "4", "Location Priority": "10", "Applied": "TRUE", "Sustainable company": "TRUE",
+     "Job Description": "JD", "Company overview": "CO", "Bad analysis": "FALSE"},
+    {"Company Name": "Beta", "Job Title": "Ops", "Location": "", "Fit score": "",
+     "Fit score enum": "", "Location Priority": "2", "Sustainable company": "TRUE",
+     "Job Description": "  ", "Company overview": ""},
+    {"Company Name": "Gamma", "Job Title": "QA", "Location": "Remote", "Fit score": "Poor fit",
+     "Fit score enum": "1", "Job posting expired": "TRUE", "Sustainable company": "FALSE",
+     "Job Description": "JD", "Company overview": "CO",
+     "Job analysis": "Insufficient company overview to judge"},
+    {"Company Name": "Delta", "Job Title": "PM", "Location": "Paris", "Fit score": "Moderate fit",
+     "Fit score enum": "2", "Applied": "FALSE", "Sustainable company": "FALSE",
+     "Job Description": "JD", "Company overview": "CO", "Job analysis": "Fine"},
+    {"Company Name": "Eps", "Job Title": "SRE", "Location": "Berlin", "Fit score": "Unknown",
+     "Sustainable company": "FALSE", "Job Description": "", "Company overview": "",
+     "Tailored resume url": "r.pdf"},
+    {"Company Name": "Zeta", "Job Title": "Data", "Location": "Remote", "Fit score": "Good fit",
+     "Fit score enum": "3", "Job Description": "JD", "Company overview": "CO", "Bad analysis": "TRUE"},
+]
+
+
+@pytest.fixture(scope="module")
+def page_df():
+    raw = pd.DataFrame(
+        [{col: "" for col in SHEET_HEADER} | row for row in ROWS],
+        columns=SHEET_HEADER,
+        index=pd.Index([11, 3, 7, 42, 5, 8]),
+    )
+    return _typed_jobs_frame(raw)
+
+
+class TestJobCardMeta:
+    @pytest.mark.parametrize("show_sustainability", [False, True])
+    def test_matches_per_row_reference(self, page_df, show_sustainability):
+        meta = job_card_meta(page_df, show_sustainability)
+        assert meta.index.equals(page_df.index)
+        columns = tuple(page_df.columns)
+        for card, row in zip(meta.itertuples(index=False), page_df.itertuples(index=False)):
+            title, missing_jd, missing_co, unsustainable_no_co = reference_meta(
+                row_values(row, columns), show_sustainability
+            )
+            assert card.title == title
+            assert card.missing_jd == missing_jd
+            assert card.missing_co == missing_co
+            assert card.unsustainable_no_co == unsustainable_no_co
+
+    def test_missing_values_match_reference(self, page_df):
+        df = page_df.copy()
+        df.loc[11, "Location"] = None
+        df.loc[3, "Fit score"] = None
+        df.loc[7, "Company Name"] = None
+        df.loc[42, "Job Description"] = None
+        df.loc[42, "Job analysis"] = None
+        df.loc[5, "Company overview"] = None
+        meta = job_card_meta(df, True)
+        columns = tuple(df.columns)
+        for card, row in zip(meta.itertuples(index=False), df.itertuples(index=False)):
+            title, missing_jd, missing_co, unsustainable_no_co = reference_meta(
+                row_values(row, columns), True
+            )
+            assert (card.title, card.missing_jd, card.missing_co, card.unsustainable_no_co) == (
+                title, missing_jd, missing_co, unsustainable_no_co
+            )
+
+    def test_empty_page(self, page_df):
+        meta = job_card_meta(page_df.iloc[:0], True)
+        assert len(meta) == 0
+        assert list(meta.columns) == ["title", "missing_jd", "missing_co", "unsustainable_no_co"]
+
+
+class TestCardColumns:
+    def test_matches_row_values(self, page_df):
+        cols = card_columns(page_df)
+        assert tuple(cols) == CARD_COLUMNS
+        columns = tuple(page_df.columns)
+        for i, row in enumerate(page_df.itertuples(index=False)):
+            expected = row_values(row, columns)
+            assert {col: cols[col][i] for col in CARD_COLUMNS} == {col: expected[col] for col in CARD_COLUMNS}
+
+    def test_display_strings_na_categorical_and_numeric(self):
+        flags = pd.Series([True, False, pd.NA], dtype="boolean")
+        assert _display_strings(flags).tolist() == ["TRUE", "FALSE", ""]
+        category = pd.Series(["Good fit", None, ""], dtype="category")
+        assert _display_strings(category).tolist() == ["Good fit", "", ""]
+        numeric = pd.Series(["10", "2", ""]).astype(pd.CategoricalDtype(["", "2", "10"], ordered=True))
+        assert _display_strings(numeric).tolist() == ["10", "2", ""]
+        assert _display_strings(pd.Series(["a", None], dtype="str")).tolist() == ["a", ""]
@@ -0,0 +1,79 @@
+"""Unit tests for the SQLite JobDatabase."""
+
+from local_storage import JobDatabase
+
+
+COLUMNS = ["Company Name", "Job Title", "Job URL", "Applied"]
+
+
+class TestJobDatabase:
+    def test_update_job_by_key(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"), COLUMNS)
+        db.add_jobs([{"Company Name": "A", "Job Title": "T", "Job URL": "u1"}])
+        assert db.update_job_by_key("u1", "A", {"Applied": "TRUE"}) == 1
+        assert db.update_job_by_key("u2", "A", {"Applied": "TRUE"}) == 0
+        assert db.get_all_records()[0]["Applied"] == "TRUE"
+
+    def test_pragmas_applied_to_each_connection(self, tmp_path):
+        db = JobDatabase(
+            str(tmp_path / "jobs.db"),
+            COLUMNS,
+            pragmas=("journal_mode=WAL", "synchronous=NORMAL"),
+        )
+        conn = db._get_connection()
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+    def test_bulk_update_by_key_keeps_order_per_column(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"), COLUMNS)
+        db.add_jobs([
+            {"Company Name": "A", "Job Title": "T1", "Job URL": "u1"},
+            {"Company Name": "B", "Job Title": "T2", "Job URL": "u2"},
+        ])
+        db.bulk_update_by_key([
+            ("u1", "A", {"Applied": "TRUE"}),
+            ("u2", "B", {"Job Title": "T2b"}),
+            ("u1", "A", {"Applied": "FALSE"}),
+            ("u2", "B", {"Applied": "TRUE", "Job Title": "T2c"}),
+        ])
+        records = db.get_all_records()
+        assert records[0]["Applied"] == "FALSE"
+        assert records[1]["Applied"] == "TRUE"
+        assert records[1]["Job Title"] == "T2c"
+
+    def test_bulk_update_by_key_mixed_columns_same_row(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"), COLUMNS)
+        db.add_jobs([{"Company Name": "A", "Job Title": "T1", "Job URL": "u1"}])
+        db.bulk_update_by_key([
+            ("u1", "A", {"Applied": "1", "Job Title": "1"}),
+            ("u1", "A", {"Applied": "2"}),
+            ("u1", "A", {"Applied": "3", "Job Title": "3"}),
+            ("u1", "A", {}),
+        ])
+        record = db.get_all_records()[0]
+        assert record["Applied"] == "3"
+        assert record["Job Title"] == "3"
+
+    def test_get_all_tuples(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"), COLUMNS)
+        db.add_jobs([{"Company Name": "A", "Job Title": "T1", "Job URL": "u1"}])
+        columns, rows = db.get_all_tuples()
+        assert columns == ["id", *COLUMNS]
+        assert len(rows) == 1 and type(rows[0]) is tuple
+        assert rows[0][columns.index("Company Name")] == "A"
+
+    def test_get_all_as_dataframe(self, tmp_path):
+        db = JobDatabase(str(tmp_path / "jobs.db"), COLUMNS)
+        db.add_jobs([
+            {"Company Name": "A", "Job Title": "T1", "Job URL": "u1"},
+            {"Company Name": "B", "Job Title": "T2", "Job URL": "u2", "Applied": "TRUE"},
+        ])
+        for read_only in (False, True):
+            df = db.get_all_as_dataframe(read_only=read_only)
+            assert list(df.columns) == COLUMNS
+            assert df.index.tolist() == [1, 2]
+            assert df.loc[1, "Applied"] == ""
+            assert df.loc[2, "Applied"] == "TRUE"